@@ -18,18 +18,102 @@ Example CSV pattern:
 """
 
 import http.server
+import io
 import socketserver
 import webbrowser
 import json
-import csv
+import hashlib
 import math
+import mmap
+import multiprocessing
+import os
+import pickle
+import sqlite3
+import sys
+import tempfile
 import threading
 import time
+import uuid
+import zlib
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import accumulate, chain, compress, islice, repeat
 from pathlib import Path
-from collections import defaultdict
+from collections import OrderedDict, deque, namedtuple
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
+from urllib.parse import parse_qs, urlsplit
+
+# Optional fast JSON encoder for responses; the stdlib json module is the fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional response compressors; gzip (zlib) is always available
+try:
+    import brotli
+except ImportError:
+    brotli = None
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
 
 PORT = 8765
 
+# CSV columns used by the analyzer, in SampleColumns field order
+CSV_COLUMNS = ('Timestamp_ms', 'Sensor_ID', 'Accel_X', 'Accel_Y', 'Accel_Z', 'Gyro_Y')
+
+CYCLE_WINDOW_MS = 100  # Max time between first and last sensor in a reading cycle
+MAX_SPINE_FRAMES = 500  # Target number of sampled spine frames per session
+CSV_CHUNK_ROWS = 65536  # Samples per parsed chunk when reading line by line
+CSV_BLOCK_BYTES = 1024 * 1024  # Bytes per tokenized block of a memory-mapped CSV
+STREAMING_THRESHOLD_BYTES = 512 * 1024 * 1024  # Files above this are analyzed in streaming mode
+LAST_TIMESTAMP_SCAN_BYTES = 16 * 1024 * 1024  # Tail bytes (besides NUL padding) searched for the last row
+MAX_SESSIONS = 32  # Analyzed sessions kept in memory for /frames queries
+MAX_FRAMES_PER_REQUEST = 5000  # Upper bound on max_frames for /frames
+PYRAMID_FACTOR = 4  # Frame rate reduction between pyramid levels
+CURVATURE_BATCH_CYCLES = 4096  # Cycles reconstructed per batch for max curvature in streaming mode
+ANALYSIS_WORKERS = os.cpu_count() or 1  # Worker processes analyzing uploads (bounded pool)
+JOB_TTL_SECONDS = 30 * 60  # Finished analysis jobs are kept this long for /jobs/<id>
+UPLOAD_CHUNK_BYTES = 256 * 1024  # Socket read size for the streaming multipart parser
+MAX_PART_HEADER_BYTES = 16 * 1024  # Larger multipart part headers are rejected
+UPLOAD_SPILL_BYTES = 64 * 1024 * 1024  # Uploaded files above this go to a temp file instead of memory
+ANALYSIS_VERSION = 5  # Bump whenever analysis output changes, to invalidate cached results
+CACHE_DIR = Path.home() / '.cache' / 'spine_dashboard' / 'results'  # Cached analyses by content hash
+CACHE_MAX_BYTES = 2 * 1024 * 1024 * 1024  # Least recently used cached analyses are evicted above this
+SAMPLES_DIR = Path.home() / '.cache' / 'spine_dashboard' / 'samples'  # Parsed CSV columns by content hash
+SAMPLES_MAX_BYTES = 4 * 1024 * 1024 * 1024  # Least recently used parsed samples are evicted above this
+RESPONSE_CHUNK_BYTES = 64 * 1024  # Encoded response pieces handed to the compressor and sent as HTTP chunks
+JSON_BATCH_ITEMS = 256  # List items encoded per JSON encoder call
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5  # Higher qualities are too slow to stream multi-MB results
+ZSTD_LEVEL = 3
+SESSION_DB = Path.home() / '.local' / 'share' / 'spine_dashboard' / 'sessions.sqlite3'  # Stored analyzed sessions
+MAX_SESSIONS_PER_LISTING = 1000  # Upper bound on limit for /sessions
+
+# Parsed samples as typed contiguous columns (one array per CSV column)
+SampleColumns = namedtuple('SampleColumns', 'timestamps sensor_ids accel_x accel_y accel_z gyro_y')
+
+# Samples cache files: magic, native uint64 sample count, then each column
+# in SampleColumns order as int32 timestamps, int16 sensor IDs and
+# accelerations, and float32 gyro, which keeps every column aligned
+SAMPLES_MAGIC = b'SPNSMP01'
+SAMPLES_TYPECODES = ('i', 'h', 'h', 'h', 'h', 'f')
+
+# One session as a dense (cycles x sensors) row-major matrix: cycle start
+# times in ms and float32 angles, 0 where a sensor did not report
+SessionMatrix = namedtuple('SessionMatrix', 'cycle_times sensor_order angles')
+
+# One level of a session's frame pyramid: every stride-th non-empty cycle,
+# its start time in ms, and reconstructed float32 spine points (frames x sensors)
+PyramidLevel = namedtuple('PyramidLevel', 'stride cycle_indices cycle_times xs ys')
+
+# An analyzed session kept by the server for frame queries
+Session = namedtuple('Session', 'matrix pyramid')
+
 def compute_angle_from_accel(ax, ay, az):
     """CurvImu algorithm for angle calculation"""
     scale = 8192.0
@@ -52,6 +136,38 @@ def compute_angle_from_accel(ax, ay, az):
     return angle
 
 
+def compute_angles_from_accel(ax_col, ay_col, az_col):
+    """Batch compute_angle_from_accel over whole accelerometer columns, as array('d')"""
+    scale = 8192.0
+    deadzoneRaw = int(0.03 * scale)
+    saturationRaw = int(0.98 * scale)
+    atan2 = math.atan2
+    sqrt = math.sqrt
+    pi = math.pi
+    
+    angles = array('d')
+    append = angles.append
+    for ax, ay, az in zip(ax_col, ay_col, az_col):
+        xRaw = ax if ax != 0 else 10
+        yUsed = 0 if -deadzoneRaw < ay < deadzoneRaw else ay
+        zUsed = 0 if -deadzoneRaw < az < deadzoneRaw else az
+        
+        if (yUsed == 0 and zUsed == 0 and
+                (xRaw > saturationRaw or xRaw < -saturationRaw)):
+            # Saturation snap: sensor axis aligned with gravity
+            append(180.0 if xRaw < 0 else 0.0)
+            continue
+        
+        angle = atan2(sqrt(yUsed * yUsed + zUsed * zUsed), abs(xRaw)) * 180.0 / pi
+        if xRaw < 0:
+            angle = 180.0 - angle
+        if az < 0:
+            angle = -angle
+        append(angle)
+    
+    return angles
+
+
 def build_spine_from_angles(angles, spacing_cm=9.0):
     """Build spine curve from angles using CurvImu algorithm"""
     if not angles:
@@ -89,37 +205,769 @@ def build_spine_from_angles(angles, spacing_cm=9.0):
     return [(x * 100, y * 100) for x, y in locs]
 
 
-def load_and_analyze_csv(file_path, original_filename=None):
-    """Load CSV and compute comprehensive metrics"""
-    print(f"📂 Loading: {file_path}")
+def build_spines_from_angle_matrix(angles, n_sensors, spacing_cm=9.0):
+    """Batched build_spine_from_angles over a row-major (frames x sensors) angle matrix
+
+    Returns (xs, ys), point matrices of the same shape in cm.
+    """
+    radius = spacing_cm / 100.0  # Convert to meters
+    rads = list(map(math.radians, angles))
+    dxs = [radius * v for v in map(math.sin, rads)]
+    dys = [radius * v for v in map(math.cos, rads)]
+    
+    xs = array('d')
+    ys = array('d')
+    if not n_sensors:
+        return xs, ys
+    
+    for start in range(0, len(rads), n_sensors):
+        stop = start + n_sensors
+        # Integrate from the first sensor; points are listed last sensor first
+        px = list(accumulate(dxs[start:stop]))
+        py = list(accumulate(dys[start:stop]))
+        px.reverse()
+        py.reverse()
+        
+        # Center and convert to cm
+        avg_x = sum(px) / n_sensors
+        avg_y = sum(py) / n_sensors
+        xs.extend([(x - avg_x) * 100 for x in px])
+        ys.extend([(y - avg_y) * 100 for y in py])
+    
+    return xs, ys
+
+
+def _csv_column_indices(header_line):
+    """Resolve CSV_COLUMNS positions from a raw header line (None if any is missing)"""
+    header = [name.strip() for name in header_line.decode('utf-8', errors='ignore').split(',')]
+    try:
+        return tuple(header.index(name) for name in CSV_COLUMNS)
+    except ValueError:
+        print(f"⚠ Missing required CSV columns (need {', '.join(CSV_COLUMNS)})")
+        return None
+
+
+def _new_sample_columns():
+    """Empty SampleColumns with the analyzer's column types"""
+    return SampleColumns(array('q'), array('q'), array('q'), array('q'), array('q'), array('d'))
+
+
+def _append_csv_lines(chunk, lines, indices):
+    """Parse CSV lines one at a time into chunk, skipping malformed rows"""
+    i_ts, i_sid, i_ax, i_ay, i_az, i_gy = indices
+    max_split = max(indices) + 1
+    
+    for line in lines:
+        fields = line.split(b',', max_split)
+        try:
+            ts = int(fields[i_ts])
+            sid = int(fields[i_sid])
+            ax = int(fields[i_ax])
+            ay = int(fields[i_ay])
+            az = int(fields[i_az])
+            gy = float(fields[i_gy])  # Angular velocity in rad/s
+        except (ValueError, IndexError):
+            continue
+        chunk.timestamps.append(ts)
+        chunk.sensor_ids.append(sid)
+        chunk.accel_x.append(ax)
+        chunk.accel_y.append(ay)
+        chunk.accel_z.append(az)
+        chunk.gyro_y.append(gy)
+
+
+def _append_csv_block(chunk, lines, indices, ncols):
+    """Parse a block of CSV lines into chunk a whole column at a time"""
+    expected = ncols - 1
+    counts = list(map(bytes.count, lines, repeat(b',')))
+    if counts.count(expected) == len(counts):
+        irregular = []
+    else:
+        irregular = [i for i, count in enumerate(counts) if count != expected]
+    
+    run_start = 0
+    for stop in irregular + [len(lines)]:
+        run = lines[run_start:stop]
+        if run:
+            flat = b','.join(run).split(b',')
+            try:
+                parsed = [array('q', map(int, flat[i::ncols])) for i in indices[:5]]
+                parsed.append(array('d', map(float, flat[indices[5]::ncols])))
+            except ValueError:
+                _append_csv_lines(chunk, run, indices)
+            else:
+                for col, values in zip(chunk, parsed):
+                    col.extend(values)
+        if stop < len(lines):
+            _append_csv_lines(chunk, lines[stop:stop + 1], indices)
+        run_start = stop + 1
+
+
+def _iter_mapped_chunks(buf, block_size=CSV_BLOCK_BYTES):
+    """Tokenize a memory-mapped CSV in place; returns the number of bytes consumed"""
+    header_end = buf.find(b'\n')
+    if header_end == -1:
+        return len(buf)
+    header_line = buf[:header_end]
+    indices = _csv_column_indices(header_line)
+    if indices is None:
+        return len(buf)
+    ncols = header_line.count(b',') + 1
+    
+    size = len(buf)
+    pos = header_end + 1
+    released = 0
+    if hasattr(buf, 'madvise'):
+        buf.madvise(mmap.MADV_SEQUENTIAL)
+    while pos < size:
+        end = size
+        if pos + block_size < size:
+            end = buf.rfind(b'\n', pos, pos + block_size)
+            if end == -1:
+                # A single line longer than the block
+                end = buf.find(b'\n', pos + block_size)
+                if end == -1:
+                    end = size
+        
+        chunk = _new_sample_columns()
+        # bytes() only copies when buf is a bytearray; mmap slices are bytes already
+        _append_csv_block(chunk, bytes(buf[pos:end]).split(b'\n'), indices, ncols)
+        pos = end + 1
+        
+        # Drop the pages already tokenized from our resident set; they stay
+        # in the OS page cache but no longer count against this process
+        if hasattr(buf, 'madvise'):
+            done = min(pos, size) // mmap.PAGESIZE * mmap.PAGESIZE
+            if done > released:
+                buf.madvise(mmap.MADV_DONTNEED, released, done - released)
+                released = done
+        if chunk.timestamps:
+            yield chunk
+    
+    return size
+
+
+def _iter_stream_chunks(f, chunk_rows):
+    """Parse a binary file object into chunks; returns the number of bytes consumed"""
+    indices = _csv_column_indices(f.readline())
+    if indices is None:
+        return f.tell()
+    
+    chunk = _new_sample_columns()
+    for lines in iter(lambda: list(islice(f, chunk_rows)), []):
+        _append_csv_lines(chunk, lines, indices)
+        if len(chunk.timestamps) >= chunk_rows:
+            yield chunk
+            chunk = _new_sample_columns()
+    
+    if chunk.timestamps:
+        yield chunk
+    
+    return f.tell()
+
+
+@contextmanager
+def _open_csv_source(source):
+    """Binary file object over a CSV path, bytes buffer or seekable file object"""
+    if isinstance(source, (bytes, bytearray)):
+        yield io.BytesIO(source)
+    elif hasattr(source, 'read'):
+        source.seek(0)
+        yield source
+    else:
+        with open(source, 'rb') as f:
+            yield f
+
+
+def _csv_source_size(source):
+    """Size in bytes of a CSV path, bytes buffer or seekable file object"""
+    if isinstance(source, (bytes, bytearray)):
+        return len(source)
+    if hasattr(source, 'read'):
+        return source.seek(0, os.SEEK_END)
+    return os.path.getsize(source)
+
+
+def _csv_source_digest(source):
+    """sha256 hex digest of a CSV path, bytes buffer or seekable file object"""
+    digest = hashlib.sha256()
+    if isinstance(source, (bytes, bytearray)):
+        digest.update(source)
+    else:
+        with _open_csv_source(source) as f:
+            for block in iter(lambda: f.read(CSV_BLOCK_BYTES), b''):
+                digest.update(block)
+    return digest.hexdigest()
+
+
+def _csv_source_label(source):
+    """Printable name of a CSV source: its path, file name or buffer size"""
+    if isinstance(source, (bytes, bytearray)):
+        return f"<{len(source)} bytes in memory>"
+    if hasattr(source, 'read'):
+        name = getattr(source, 'name', None)
+        return name if isinstance(name, str) else "<stream>"
+    return str(source)
+
+
+def iter_csv_chunks(file_path, chunk_rows=CSV_CHUNK_ROWS):
+    """Parse the analyzer's CSV columns into SampleColumns chunks of typed arrays
+
+    file_path may also be a bytes buffer or a seekable binary file object.
+    """
+    start = time.perf_counter()
     
-    # Load all data
-    rows = []
-    with open(file_path, 'r') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
+    if isinstance(file_path, (bytes, bytearray)):
+        size = yield from _iter_mapped_chunks(file_path)
+    else:
+        with _open_csv_source(file_path) as f:
             try:
-                ts = int(row['Timestamp_ms'])
-                sid = int(row['Sensor_ID'])
-                ax = int(row['Accel_X'])
-                ay = int(row['Accel_Y'])
-                az = int(row['Accel_Z'])
-                gy = float(row['Gyro_Y'])  # Angular velocity in rad/s
-                rows.append((ts, sid, ax, ay, az, gy))
-            except:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, OSError):
+                # Empty files, pipes and in-memory streams cannot be mapped
+                mapped = None
+            
+            if mapped is not None:
+                with mapped:
+                    size = yield from _iter_mapped_chunks(mapped)
+            else:
+                size = yield from _iter_stream_chunks(f, chunk_rows)
+    
+    size_mb = size / (1024 * 1024)
+    elapsed = time.perf_counter() - start
+    print(f"✓ Parsed {size_mb:.1f} MB in {elapsed:.2f}s ({size_mb / elapsed if elapsed > 0 else 0:.1f} MB/s)")
+
+
+def read_csv_columns(file_path):
+    """Read the analyzer's CSV columns straight into typed arrays"""
+    columns = _new_sample_columns()
+    for chunk in iter_csv_chunks(file_path):
+        for col, part in zip(columns, chunk):
+            col.extend(part)
+    return columns
+
+
+def find_last_timestamp(file_path, block_size=65536, max_scan_bytes=LAST_TIMESTAMP_SCAN_BYTES):
+    """Timestamp of the last valid row, read backwards from the end (None if not found)"""
+    with _open_csv_source(file_path) as f:
+        indices = _csv_column_indices(f.readline())
+        if indices is None:
+            return None
+        max_split = max(indices) + 1
+        data_start = f.tell()
+        
+        pos = f.seek(0, os.SEEK_END)
+        scanned = 0
+        pieces = []  # The line cut by the last block read, as blocks from last to first
+        while pos > data_start and scanned < max_scan_bytes:
+            step = min(block_size, pos - data_start)
+            pos -= step
+            f.seek(pos)
+            block = f.read(step)
+            if not pieces and block == bytes(step):
+                continue
+            scanned += step
+            
+            lines = block.split(b'\n')
+            pieces.append(lines.pop())
+            if not lines and pos > data_start:
                 continue
+            complete = lines + [b''.join(reversed(pieces))]
+            # The first line may be cut in half unless we reached the header
+            pieces = [complete.pop(0)] if pos > data_start else []
+            for line in reversed(complete):
+                fields = line.split(b',', max_split)
+                try:
+                    # Same validity rules as iter_csv_chunks
+                    values = [int(fields[i]) for i in indices[:5]]
+                    float(fields[indices[5]])
+                except (ValueError, IndexError):
+                    continue
+                return values[0]
+    return None
+
+
+def filter_columns(columns, keep):
+    """Return the samples whose keep flag is true, as new typed columns"""
+    return SampleColumns(*(array(col.typecode if isinstance(col, array) else col.format, compress(col, keep))
+                           for col in columns))
+
+
+def trim_chunks(chunks, start_cutoff, end_cutoff):
+    """Drop samples outside [start_cutoff, end_cutoff] from a stream of chunks"""
+    for chunk in chunks:
+        keep = [start_cutoff <= ts <= end_cutoff for ts in chunk.timestamps]
+        if all(keep):
+            yield chunk
+        elif any(keep):
+            yield filter_columns(chunk, keep)
+
+
+def trim_tail(chunks, margin_ms):
+    """Drop samples within margin_ms of the last timestamp of a stream of chunks"""
+    held = deque()
+    for chunk in chunks:
+        held.append(chunk)
+        while held[0].timestamps[-1] <= chunk.timestamps[-1] - margin_ms:
+            yield held.popleft()
+    if held:
+        yield from trim_chunks(held, float('-inf'), held[-1].timestamps[-1] - margin_ms)
+
+
+def segment_reading_cycles(timestamps, sensor_ids, sensor_bits=None, carry=None):
+    """Find reading-cycle boundaries over whole timestamp and sensor-id columns
+
+    carry=(start_time, mask) continues a previous chunk's open cycle, whose
+    rows get cycle ID -1. Returns (cycle_starts, cycle_ids, carry).
+    """
+    if sensor_bits is None:
+        sensor_bits = {}
+    start_time, mask = carry if carry is not None else (None, 0)
     
-    if not rows:
-        return None
+    cycle_starts = array('q')
+    cycle_ids = array('q')
+    cycle = -1
+    bit_of = sensor_bits.get
+    
+    for i, (ts, sid) in enumerate(zip(timestamps, sensor_ids)):
+        bit = bit_of(sid)
+        if bit is None:
+            bit = sensor_bits[sid] = 1 << len(sensor_bits)
+        
+        if start_time is None or mask & bit or ts - start_time > CYCLE_WINDOW_MS:
+            cycle += 1
+            cycle_starts.append(i)
+            start_time = ts
+            mask = bit
+        else:
+            mask |= bit
+        cycle_ids.append(cycle)
+    
+    return cycle_starts, cycle_ids, (start_time, mask)
+
+
+def iter_reading_cycles(chunks):
+    """Group sample chunks into (cycle_start_time, {sensor_id: (ts, angle, gyro)}) cycles"""
+    sensor_bits = {}
+    carry = None
+    current_cycle = {}
+    current_cycle_start_time = None
+    
+    for chunk in chunks:
+        # Compute all angles in one batch over the accelerometer columns
+        angles = compute_angles_from_accel(chunk.accel_x, chunk.accel_y, chunk.accel_z)
+        cycle_starts, cycle_ids, carry = segment_reading_cycles(
+            chunk.timestamps, chunk.sensor_ids, sensor_bits, carry)
+        
+        current_id = -1
+        for ts, sid, angle, gy, cycle_id in zip(chunk.timestamps, chunk.sensor_ids, angles, chunk.gyro_y, cycle_ids):
+            if cycle_id != current_id:
+                # Emit previous cycle
+                if current_cycle:
+                    yield current_cycle_start_time, current_cycle
+                current_cycle = {}
+                current_cycle_start_time = ts
+                current_id = cycle_id
+            # Convert gyroscope from rad/s to deg/s
+            current_cycle[sid] = (ts, angle, gy * 180.0 / math.pi)
+    
+    # Don't forget the last cycle
+    if current_cycle:
+        yield current_cycle_start_time, current_cycle
+
+
+def build_session_matrix(cycle_times, sensor_order, cycle_ids, sensor_ids, angles):
+    """Scatter per-reading angles into a dense (cycles x sensors) SessionMatrix"""
+    n_sensors = len(sensor_order)
+    size = len(cycle_times) * n_sensors
+    column_of = {sid: j for j, sid in enumerate(sensor_order)}
+    
+    angle_matrix = array('f', bytes(4 * size))
+    
+    for cycle_id, sid, angle in zip(cycle_ids, sensor_ids, angles):
+        angle_matrix[cycle_id * n_sensors + column_of[sid]] = angle
+    
+    return SessionMatrix(array('q', cycle_times), list(sensor_order), angle_matrix)
+
+
+def build_spine_curves(matrix, cycle_indices):
+    """Spine curve frames for the given cycles of a SessionMatrix"""
+    n_sensors = len(matrix.sensor_order)
+    
+    # Get ALL sensor angles for each reading cycle; each row represents the
+    # complete spine position at that moment. Empty frames are skipped.
+    frames = []
+    for c in cycle_indices:
+        frame_angles = matrix.angles[c * n_sensors:(c + 1) * n_sensors]
+        if any(frame_angles):
+            frames.append((c, frame_angles))
+    
+    angle_rows = array('f')
+    for c, frame_angles in frames:
+        angle_rows.extend(frame_angles)
+    xs, ys = build_spines_from_angle_matrix(angle_rows, n_sensors)
+    
+    spine_curves = []
+    for i, (c, frame_angles) in enumerate(frames):
+        row = slice(i * n_sensors, (i + 1) * n_sensors)
+        spine_curves.append({
+            'time': matrix.cycle_times[c]/1000.0,
+            'points': list(zip(xs[row], ys[row])),
+            'angles': frame_angles.tolist()
+        })
+    
+    return spine_curves
+
+
+def build_frame_pyramid(matrix):
+    """Precompute level-of-detail spine frames, each level 1/PYRAMID_FACTOR of the last"""
+    n_sensors = len(matrix.sensor_order)
+    cycle_indices = array('q', (c for c in range(len(matrix.cycle_times))
+                                if any(matrix.angles[c * n_sensors:(c + 1) * n_sensors])))
+    angle_rows = array('f')
+    for c in cycle_indices:
+        angle_rows.extend(matrix.angles[c * n_sensors:(c + 1) * n_sensors])
+    xs, ys = build_spines_from_angle_matrix(angle_rows, n_sensors)
+    
+    level = PyramidLevel(1, cycle_indices, array('q', (matrix.cycle_times[c] for c in cycle_indices)),
+                         array('f', xs), array('f', ys))
+    pyramid = [level]
+    
+    while len(level.cycle_indices) > 1:
+        xs = array('f')
+        ys = array('f')
+        for f in range(0, len(level.cycle_indices), PYRAMID_FACTOR):
+            xs.extend(level.xs[f * n_sensors:(f + 1) * n_sensors])
+            ys.extend(level.ys[f * n_sensors:(f + 1) * n_sensors])
+        level = PyramidLevel(level.stride * PYRAMID_FACTOR,
+                             level.cycle_indices[::PYRAMID_FACTOR],
+                             level.cycle_times[::PYRAMID_FACTOR], xs, ys)
+        pyramid.append(level)
+    
+    return pyramid
+
+
+class RunningStats:
+    """Streaming count/sum/min/max accumulator, updated once per reading"""
+    
+    __slots__ = ('count', 'total', 'min', 'max')
+    
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+    
+    def add(self, value):
+        self.count += 1
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+    
+    def merge(self, other):
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+    
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else 0
+    
+    @property
+    def range(self):
+        return self.max - self.min if self.count else 0
+
+
+def accumulate_sensor_stats(sensor_ids, angles, angular_velocities, sensor_stats=None):
+    """Add readings to per-sensor (angle, angular velocity) RunningStats in one pass"""
+    if sensor_stats is None:
+        sensor_stats = {}
+    
+    for sid, angle, velocity in zip(sensor_ids, angles, angular_velocities):
+        stats = sensor_stats.get(sid)
+        if stats is None:
+            stats = sensor_stats[sid] = (RunningStats(), RunningStats())
+        stats[0].add(angle)
+        stats[1].add(velocity)
+    
+    return sensor_stats
+
+
+def summarize_sensor_stats(sensor_order, sensor_stats):
+    """Compute ROM, angle and angular velocity metrics from per-sensor RunningStats"""
+    angle_stats = [sensor_stats[sid][0] for sid in sensor_order]
+    velocity_stats = [sensor_stats[sid][1] for sid in sensor_order]
+    
+    def merged(stats, columns):
+        total = RunningStats()
+        for j in columns:
+            total.merge(stats[j])
+        return total
+    
+    # Sections by position along the spine
+    n = len(sensor_order)
+    upper = range(0, n//3)
+    middle = range(n//3, 2*n//3)
+    lower = range(2*n//3, n)
+    all_angles = merged(angle_stats, range(n))
+    
+    return {
+        'sensors': n,
+        'total_rom': all_angles.range,
+        'upper_rom': merged(angle_stats, upper).range,
+        'middle_rom': merged(angle_stats, middle).range,
+        'lower_rom': merged(angle_stats, lower).range,
+        'avg_angle': all_angles.mean,
+        'upper_angular_velocity': merged(velocity_stats, upper).mean,
+        'middle_angular_velocity': merged(velocity_stats, middle).mean,
+        'lower_angular_velocity': merged(velocity_stats, lower).mean,
+        'sensor_roms': {sid: stats.range for sid, stats in zip(sensor_order, angle_stats)},
+        # Average spine position (average angles across all time)
+        'avg_spine': build_spine_from_angles([stats.mean for stats in angle_stats]),
+    }
+
+
+def build_view_metadata(pyramid, sensor_order, sensor_stats):
+    """Chart bounds for the dashboard, so it never has to scan the frames"""
+    full_rate = pyramid[0]
+    view = {
+        'x_range': None,
+        'y_range': None,
+        'time_span': None,
+        'angle_ranges': {str(sid): [sensor_stats[sid][0].min, sensor_stats[sid][0].max] for sid in sensor_order},
+    }
+    if full_rate.cycle_indices:
+        view['x_range'] = [min(full_rate.xs), max(full_rate.xs)]
+        view['y_range'] = [min(full_rate.ys), max(full_rate.ys)]
+        view['time_span'] = [full_rate.cycle_times[0] / 1000.0, full_rate.cycle_times[-1] / 1000.0]
+    return view
+
+
+def build_result(display_filename, samples, duration, metrics, max_curvature, max_curvature_time,
+                 spine_curves, sensor_order, view):
+    """Assemble the analysis result sent to the dashboard"""
+    return {
+        'filename': display_filename,
+        'sensors': metrics['sensors'],
+        'samples': samples,
+        'duration': duration,
+        'total_rom': metrics['total_rom'],
+        'upper_rom': metrics['upper_rom'],
+        'middle_rom': metrics['middle_rom'],
+        'lower_rom': metrics['lower_rom'],
+        'avg_angle': metrics['avg_angle'],
+        'upper_angular_velocity': metrics['upper_angular_velocity'],
+        'middle_angular_velocity': metrics['middle_angular_velocity'],
+        'lower_angular_velocity': metrics['lower_angular_velocity'],
+        'max_curvature': max_curvature,
+        'max_curvature_time': max_curvature_time,
+        'sensor_roms': {str(sid): rom for sid, rom in metrics['sensor_roms'].items()},
+        'spine_curves': spine_curves,
+        'avg_spine': metrics['avg_spine'],
+        'sensor_order': [str(s) for s in sensor_order],
+        'view': view
+    }
+
+
+def compute_max_curvature(xs, ys, n_sensors):
+    """Max distance of any spine point from the line between its end points
+
+    Returns (max_curvature, frame_index), frame_index -1 if nothing bends.
+    """
+    n = n_sensors
+    if n < 3 or not xs:
+        return 0, -1
+    
+    # Line between first and last point of every frame: a*x - b*y + c = 0
+    a = [ly - fy for fy, ly in zip(ys[0::n], ys[n-1::n])]
+    b = [lx - fx for fx, lx in zip(xs[0::n], xs[n-1::n])]
+    c = [lx*fy - ly*fx for fx, fy, lx, ly in zip(xs[0::n], ys[0::n], xs[n-1::n], ys[n-1::n])]
+    # Frames whose end points coincide count as straight (distance 0)
+    norms = [math.hypot(ai, bi) or math.inf for ai, bi in zip(a, b)]
+    
+    max_curvature = 0
+    max_frame = -1
+    for j in range(1, n - 1):
+        # Distance from point to line between first and last
+        dist = [abs(ai*x - bi*y + ci) / norm
+                for ai, bi, ci, x, y, norm in zip(a, b, c, xs[j::n], ys[j::n], norms)]
+        column_max = max(dist)
+        if column_max > max_curvature:
+            max_curvature = column_max
+            max_frame = dist.index(column_max)
+    
+    return max_curvature, max_frame
+
+
+def max_curvature_of_cycles(cycles, sensor_order):
+    """Max curvature over (cycle_time, {sid: angle}) cycles as (value, seconds or None)"""
+    angle_rows = array('d')
+    for cycle_time, frame in cycles:
+        angle_rows.extend(frame.get(sid, 0.0) for sid in sensor_order)
+    xs, ys = build_spines_from_angle_matrix(angle_rows, len(sensor_order))
+    max_curvature, max_frame = compute_max_curvature(xs, ys, len(sensor_order))
+    if max_frame < 0:
+        return 0, None
+    return max_curvature, cycles[max_frame][0] / 1000.0
+
+
+def analyze_csv_streaming(file_path, original_filename=None):
+    """Analyze a CSV in constant memory; returns (result, session) with sampled frames"""
+    print(f"📂 Streaming: {_csv_source_label(file_path)}")
+    
+    # The end is found with a tail seek before parsing starts: a file object
+    # has one position, which the seek would move from under the parser
+    last_timestamp = find_last_timestamp(file_path)
+    chunks = iter_csv_chunks(file_path)
+    first_chunk = next(chunks, None)
+    if first_chunk is None:
+        return None, None
+    
+    # Chop first and last 5 minutes of data
+    first_timestamp = first_chunk.timestamps[0]
+    FIVE_MINUTES_MS = 5 * 60 * 1000
+    start_cutoff = first_timestamp + FIVE_MINUTES_MS
+    
+    counts = {'loaded': 0, 'kept': 0}
+    
+    def counted(stream, key):
+        for chunk in stream:
+            counts[key] += len(chunk.timestamps)
+            yield chunk
+    
+    loaded = counted(chain([first_chunk], chunks), 'loaded')
+    if last_timestamp is not None:
+        kept = trim_chunks(loaded, start_cutoff, last_timestamp - FIVE_MINUTES_MS)
+    else:
+        # No valid row found near the end: trim it while streaming instead
+        kept = trim_tail(trim_chunks(loaded, start_cutoff, float('inf')), FIVE_MINUTES_MS)
+    kept = counted(kept, 'kept')
+    
+    # Running (angle, angular velocity) aggregates per sensor
+    sensor_stats = {}
+    sampled_frames = []
+    stride = 1
+    curvature_batch = []
+    max_curvature = (0, None)
+    cycle_count = 0
+    first_cycle_time = None
+    last_cycle_time = None
+    
+    for cycle_time, cycle_data in iter_reading_cycles(kept):
+        if first_cycle_time is None:
+            first_cycle_time = cycle_time
+        last_cycle_time = cycle_time
+        
+        for sid, (ts, angle, gy_deg_per_sec) in cycle_data.items():
+            stats = sensor_stats.get(sid)
+            if stats is None:
+                stats = sensor_stats[sid] = (RunningStats(), RunningStats())
+            stats[0].add(angle)
+            stats[1].add(abs(gy_deg_per_sec))
+        
+        curvature_batch.append((cycle_time, {sid: angle for sid, (ts, angle, gy) in cycle_data.items()}))
+        if len(curvature_batch) >= CURVATURE_BATCH_CYCLES:
+            max_curvature = max(max_curvature, max_curvature_of_cycles(curvature_batch, sorted(sensor_stats, reverse=True)),
+                                key=lambda found: found[0])
+            curvature_batch = []
+        
+        if cycle_count % stride == 0:
+            sampled_frames.append((cycle_time, {sid: angle for sid, (ts, angle, gy) in cycle_data.items()}))
+            if len(sampled_frames) >= MAX_SPINE_FRAMES * 2:
+                sampled_frames = sampled_frames[::2]
+                stride *= 2
+        cycle_count += 1
+    
+    print(f"✓ Loaded {counts['loaded']} samples")
+    removed_count = counts['loaded'] - counts['kept']
+    if removed_count > 0:
+        print(f"✓ Removed {removed_count} samples (first/last 5 minutes)")
+        print(f"✓ Remaining {counts['kept']} samples")
+    else:
+        print(f"⚠ Warning: Data duration is less than 10 minutes, no data removed")
+    
+    if not cycle_count:
+        return None, None
+    
+    print(f"✓ {cycle_count} reading cycles detected")
+    print(f"✓ {len(sensor_stats)} sensors detected")
+    
+    sensor_order = sorted(sensor_stats.keys(), reverse=True)
+    
+    # Sampled frames as a small SessionMatrix for the shared frame builder
+    readings = [(c, sid, angle)
+                for c, (ts, frame) in enumerate(sampled_frames)
+                for sid, angle in frame.items()]
+    matrix = build_session_matrix([ts for ts, frame in sampled_frames], sensor_order, *zip(*readings))
+    spine_curves = build_spine_curves(matrix, range(len(sampled_frames)))
+    
+    print(f"✓ Generated {len(spine_curves)} spine curve frames")
+    
+    metrics = summarize_sensor_stats(sensor_order, sensor_stats)
+    if curvature_batch:
+        max_curvature = max(max_curvature, max_curvature_of_cycles(curvature_batch, sensor_order),
+                            key=lambda found: found[0])
+    max_curvature, max_curvature_time = max_curvature
+    
+    print("✓ Analysis complete")
+    
+    display_filename = original_filename if original_filename else Path(_csv_source_label(file_path)).name
+    duration = (last_cycle_time - first_cycle_time) / 1000.0
+    pyramid = build_frame_pyramid(matrix)
+    view = build_view_metadata(pyramid, sensor_order, sensor_stats)
+    
+    return build_result(display_filename, counts['kept'], duration, metrics, max_curvature, max_curvature_time,
+                        spine_curves, sensor_order, view), Session(matrix, pyramid)
+
+
+def load_and_analyze_csv(file_path, original_filename=None, streaming=None):
+    """Load CSV and compute comprehensive metrics"""
+    result, _ = analyze_csv(file_path, original_filename, streaming)
+    return result
+
+
+def analyze_csv(file_path, original_filename=None, streaming=None, content_digest=None):
+    """Load CSV and compute comprehensive metrics, keeping the session matrix
+
+    Returns (result, session), or (None, None) when there is nothing to analyze.
+    """
+    if streaming is None:
+        streaming = _csv_source_size(file_path) > STREAMING_THRESHOLD_BYTES
+    if streaming:
+        return analyze_csv_streaming(file_path, original_filename)
     
-    print(f"✓ Loaded {len(rows)} samples")
+    print(f"📂 Loading: {_csv_source_label(file_path)}")
+    
+    # Load all data, from the samples cache when this log was parsed before
+    samples_key = samples_cache_key(content_digest or _csv_source_digest(file_path))
+    columns = load_cached_samples(samples_key)
+    if columns is not None:
+        print("⚡ Mapped parsed samples from the samples cache")
+    else:
+        columns = read_csv_columns(file_path)
+        if columns.timestamps:
+            try:
+                # Analyze the compact columns either way, so results never
+                # depend on whether the samples came from the cache
+                columns = compact_sample_columns(columns)
+                store_cached_samples(samples_key, columns)
+            except OverflowError:
+                print("⚠ Samples exceed the compact column types; not caching them")
+            except OSError as e:
+                print(f"⚠ Could not cache parsed samples: {e}")
+    if not columns.timestamps:
+        return None, None
+    
+    print(f"✓ Loaded {len(columns.timestamps)} samples")
     
     # Chop first and last 5 minutes of data
-    if len(rows) > 0:
-        # Get first and last timestamps (first element of each tuple)
-        timestamps = [row[0] for row in rows]
-        first_timestamp = min(timestamps)
-        last_timestamp = max(timestamps)
+    if len(columns.timestamps) > 0:
+        first_timestamp = min(columns.timestamps)
+        last_timestamp = max(columns.timestamps)
         
         # 5 minutes in milliseconds
         FIVE_MINUTES_MS = 5 * 60 * 1000
@@ -129,181 +977,74 @@ def load_and_analyze_csv(file_path, original_filename=None):
         end_cutoff = last_timestamp - FIVE_MINUTES_MS
         
         # Filter rows to exclude first and last 5 minutes
-        original_count = len(rows)
-        rows = [row for row in rows if start_cutoff <= row[0] <= end_cutoff]
+        original_count = len(columns.timestamps)
+        keep = [start_cutoff <= ts <= end_cutoff for ts in columns.timestamps]
+        columns = filter_columns(columns, keep)
         
-        removed_count = original_count - len(rows)
+        removed_count = original_count - len(columns.timestamps)
         if removed_count > 0:
             print(f"✓ Removed {removed_count} samples (first/last 5 minutes)")
-            print(f"✓ Remaining {len(rows)} samples")
+            print(f"✓ Remaining {len(columns.timestamps)} samples")
         else:
             print(f"⚠ Warning: Data duration is less than 10 minutes, no data removed")
     
-    if not rows:
-        return None
+    if not columns.timestamps:
+        return None, None
     
     # CRITICAL FIX: Sensors are read sequentially through MUX (3-4ms apart)
     # We need to group by "reading cycle" not exact timestamp
     # A reading cycle is ~30ms window where all sensors are read in sequence
     
+    # Compute all angles in one batch over the accelerometer columns
+    angles = compute_angles_from_accel(columns.accel_x, columns.accel_y, columns.accel_z)
+    
     # Group into reading cycles based on timestamp proximity
-    reading_cycles = []
-    current_cycle = {}
-    current_cycle_start_time = None
-    CYCLE_WINDOW_MS = 100  # Max time between first and last sensor in a cycle
-    
-    for ts, sid, ax, ay, az, gy in rows:
-        angle = compute_angle_from_accel(ax, ay, az)
-        # Convert gyroscope from rad/s to deg/s
-        gy_deg_per_sec = gy * 180.0 / math.pi
-        
-        # Start new cycle if:
-        # 1. This is the first reading, OR
-        # 2. We've seen this sensor ID already in current cycle, OR
-        # 3. Too much time has passed since cycle start
-        if (current_cycle_start_time is None or 
-            sid in current_cycle or 
-            ts - current_cycle_start_time > CYCLE_WINDOW_MS):
-            
-            # Save previous cycle if it has data
-            if current_cycle:
-                # Use average timestamp of the cycle
-                avg_time = sum(current_cycle.values(), start=(0, []))[0] / len(current_cycle) if current_cycle else current_cycle_start_time
-                reading_cycles.append((current_cycle_start_time, dict(current_cycle)))
-            
-            # Start new cycle
-            current_cycle = {sid: (ts, angle, gy_deg_per_sec)}
-            current_cycle_start_time = ts
-        else:
-            # Add to current cycle
-            current_cycle[sid] = (ts, angle, gy_deg_per_sec)
+    cycle_starts, cycle_ids, _ = segment_reading_cycles(columns.timestamps, columns.sensor_ids)
+    cycle_times = [columns.timestamps[i] for i in cycle_starts]
     
-    # Don't forget the last cycle
-    if current_cycle:
-        reading_cycles.append((current_cycle_start_time, dict(current_cycle)))
+    print(f"✓ {len(cycle_starts)} reading cycles detected")
     
-    print(f"✓ {len(reading_cycles)} reading cycles detected")
+    # Convert gyroscope from rad/s to deg/s
+    angular_velocities = array('d', (abs(gy * 180.0 / math.pi) for gy in columns.gyro_y))
     
-    # Build time_frames from reading cycles
-    time_frames = {}
-    for cycle_time, cycle_data in reading_cycles:
-        time_frames[cycle_time] = {sid: angle for sid, (ts, angle, gy) in cycle_data.items()}
+    # Running aggregates per sensor, one update per reading
+    sensor_stats = accumulate_sensor_stats(columns.sensor_ids, angles, angular_velocities)
     
-    # Build sensor_data for per-sensor tracking
-    sensor_data = defaultdict(list)
-    all_sensor_ids = set()
-    for cycle_time, cycle_data in reading_cycles:
-        for sid, (ts, angle, gy_deg_per_sec) in cycle_data.items():
-            all_sensor_ids.add(sid)
-            sensor_data[sid].append({'time': ts/1000.0, 'angle': angle, 'ts_ms': ts, 'angular_velocity': abs(gy_deg_per_sec)})
+    # Dense cycles x sensors matrix, ordered top of spine first
+    sensor_order = sorted(sensor_stats.keys(), reverse=True)
+    matrix = build_session_matrix(cycle_times, sensor_order, cycle_ids, columns.sensor_ids, angles)
     
-    print(f"✓ {len(all_sensor_ids)} sensors detected")
+    print(f"✓ {len(sensor_order)} sensors detected")
     
     # Calculate spine curves over time
-    # CRITICAL: Each timestamp represents ONE complete spine position with ALL sensors
-    timestamps = sorted(time_frames.keys())
-    spine_curves = []
-    sensor_order = sorted(sensor_data.keys(), reverse=True)
-    
-    # Sample every 100ms for visualization (reduce data size)
-    sampled_timestamps = timestamps[::max(1, len(timestamps)//500)]  # Max 500 frames
-    
-    for ts in sampled_timestamps:
-        if ts in time_frames:
-            # Get ALL sensor angles for this single timestamp
-            # This represents the complete spine position at this moment
-            frame_angles = [time_frames[ts].get(sid, 0) for sid in sensor_order]
-            if any(frame_angles):
-                spine_points = build_spine_from_angles(frame_angles)
-                spine_curves.append({
-                    'time': ts/1000.0,
-                    'points': spine_points,
-                    'angles': frame_angles
-                })
+    # CRITICAL: Each reading cycle represents ONE complete spine position with ALL sensors
+    # Sample every Nth cycle for visualization (reduce data size)
+    sampled_cycles = range(0, len(cycle_times), max(1, len(cycle_times)//MAX_SPINE_FRAMES))  # Max 500 frames
+    spine_curves = build_spine_curves(matrix, sampled_cycles)
     
     print(f"✓ Generated {len(spine_curves)} spine curve frames")
     
-    # Calculate average spine position (average angles across all time)
-    avg_angles = []
-    for sid in sensor_order:
-        angles_for_sensor = [d['angle'] for d in sensor_data[sid]]
-        avg_angles.append(sum(angles_for_sensor) / len(angles_for_sensor) if angles_for_sensor else 0)
-    
-    avg_spine = build_spine_from_angles(avg_angles)
-    print(f"✓ Computed average spine position")
-    
     # Calculate metrics
-    all_angles = []
-    sensor_roms = {}
-    
-    for sid, data in sensor_data.items():
-        angles = [d['angle'] for d in data]
-        all_angles.extend(angles)
-        sensor_roms[sid] = max(angles) - min(angles) if angles else 0
-    
-    duration = (timestamps[-1] - timestamps[0]) / 1000.0
-    total_rom = max(all_angles) - min(all_angles) if all_angles else 0
-    
-    # Section ROMs
-    n = len(sensor_order)
-    upper = sensor_order[:n//3]
-    middle = sensor_order[n//3:2*n//3]
-    lower = sensor_order[2*n//3:]
+    metrics = summarize_sensor_stats(sensor_order, sensor_stats)
+    duration = (max(cycle_times) - min(cycle_times)) / 1000.0
     
-    upper_angles = [a for sid in upper for a in [d['angle'] for d in sensor_data[sid]]]
-    middle_angles = [a for sid in middle for a in [d['angle'] for d in sensor_data[sid]]]
-    lower_angles = [a for sid in lower for a in [d['angle'] for d in sensor_data[sid]]]
+    # Calculate max curvature (max distance from straight line) over every
+    # cycle, using the full-rate frames of the session's pyramid
+    pyramid = build_frame_pyramid(matrix)
+    full_rate = pyramid[0]
+    max_curvature, max_frame = compute_max_curvature(full_rate.xs, full_rate.ys, len(sensor_order))
+    max_curvature_time = full_rate.cycle_times[max_frame] / 1000.0 if max_frame >= 0 else None
     
-    upper_rom = max(upper_angles) - min(upper_angles) if upper_angles else 0
-    middle_rom = max(middle_angles) - min(middle_angles) if middle_angles else 0
-    lower_rom = max(lower_angles) - min(lower_angles) if lower_angles else 0
-    
-    # Calculate angular velocity by section
-    upper_angular_velocities = [d['angular_velocity'] for sid in upper for d in sensor_data[sid] if 'angular_velocity' in d]
-    middle_angular_velocities = [d['angular_velocity'] for sid in middle for d in sensor_data[sid] if 'angular_velocity' in d]
-    lower_angular_velocities = [d['angular_velocity'] for sid in lower for d in sensor_data[sid] if 'angular_velocity' in d]
-    
-    upper_angular_velocity = sum(upper_angular_velocities) / len(upper_angular_velocities) if upper_angular_velocities else 0
-    middle_angular_velocity = sum(middle_angular_velocities) / len(middle_angular_velocities) if middle_angular_velocities else 0
-    lower_angular_velocity = sum(lower_angular_velocities) / len(lower_angular_velocities) if lower_angular_velocities else 0
-    
-    # Calculate max curvature (max distance from straight line)
-    max_curvature = 0
-    for curve in spine_curves:
-        if len(curve['points']) >= 2:
-            # Calculate deviation from straight line
-            first = curve['points'][0]
-            last = curve['points'][-1]
-            for point in curve['points'][1:-1]:
-                # Distance from point to line between first and last
-                dist = abs((last[1]-first[1])*point[0] - (last[0]-first[0])*point[1] + last[0]*first[1] - last[1]*first[0]) / \
-                       math.sqrt((last[1]-first[1])**2 + (last[0]-first[0])**2) if first != last else 0
-                max_curvature = max(max_curvature, dist)
+    # Chart bounds for the dashboard
+    view = build_view_metadata(pyramid, sensor_order, sensor_stats)
     
     print("✓ Analysis complete")
     
     # Use original filename if provided, otherwise use file path name
-    display_filename = original_filename if original_filename else Path(file_path).name
+    display_filename = original_filename if original_filename else Path(_csv_source_label(file_path)).name
     
-    return {
-        'filename': display_filename,
-        'sensors': len(sensor_data),
-        'samples': len(rows),
-        'duration': duration,
-        'total_rom': total_rom,
-        'upper_rom': upper_rom,
-        'middle_rom': middle_rom,
-        'lower_rom': lower_rom,
-        'avg_angle': sum(all_angles) / len(all_angles) if all_angles else 0,
-        'upper_angular_velocity': upper_angular_velocity,
-        'middle_angular_velocity': middle_angular_velocity,
-        'lower_angular_velocity': lower_angular_velocity,
-        'max_curvature': max_curvature,
-        'sensor_roms': {str(sid): rom for sid, rom in sensor_roms.items()},
-        'spine_curves': spine_curves,
-        'avg_spine': avg_spine,
-        'sensor_order': [str(s) for s in sensor_order]
-    }
+    return build_result(display_filename, len(columns.timestamps), duration, metrics, max_curvature, max_curvature_time,
+                        spine_curves, sensor_order, view), Session(matrix, pyramid)
 
 
 HTML_TEMPLATE = """<!DOCTYPE html>
@@ -765,6 +1506,28 @@ HTML_TEMPLATE = """<!DOCTYPE html>
             border-color: rgba(139, 92, 246, 0.6);
         }
         
+        .upload-progress-item {
+            background: rgba(255, 255, 255, 0.05);
+            padding: 10px 18px;
+            border-radius: 10px;
+            margin-bottom: 8px;
+            border: 1px solid rgba(255, 255, 255, 0.08);
+        }
+        
+        .upload-progress-bar {
+            height: 4px;
+            margin-top: 8px;
+            border-radius: 2px;
+            background: rgba(255, 255, 255, 0.08);
+            overflow: hidden;
+        }
+        
+        .upload-progress-bar div {
+            height: 100%;
+            background: #8b5cf6;
+            transition: width 0.2s;
+        }
+        
         .file-name {
             color: rgba(255, 255, 255, 0.9);
             font-weight: 600;
@@ -794,6 +1557,23 @@ HTML_TEMPLATE = """<!DOCTYPE html>
             border-color: rgba(139, 92, 246, 0.5);
         }
         
+        .stored-sessions-controls {
+            margin-top: 20px;
+            display: flex;
+            gap: 10px;
+            align-items: center;
+            flex-wrap: wrap;
+        }
+        
+        .stored-sessions-controls input {
+            background: rgba(255, 255, 255, 0.05);
+            color: #ffffff;
+            border: 1px solid rgba(255, 255, 255, 0.1);
+            padding: 10px 16px;
+            border-radius: 10px;
+            font-size: 14px;
+        }
+        
         @media (max-width: 1200px) {
             .charts-grid { grid-template-columns: 1fr; }
         }
@@ -812,6 +1592,20 @@ HTML_TEMPLATE = """<!DOCTYPE html>
             </div>
             
             <div id="fileList" style="margin-top: 20px; display: none;"></div>
+            <div id="uploadProgress" style="margin-top: 20px; display: none;"></div>
+            
+            <div class="stored-sessions-controls">
+                <button class="comparison-toggle" onclick="loadStoredSessionList()">🗂 Stored Sessions</button>
+                <input type="text" id="storedFilter" placeholder="Filter by file name" onchange="loadStoredSessionList()">
+                <select id="storedSort" onchange="loadStoredSessionList()">
+                    <option value="created_at:desc" selected>Newest first</option>
+                    <option value="duration:desc">Longest</option>
+                    <option value="total_rom:desc">Largest ROM</option>
+                    <option value="max_curvature:desc">Highest max curvature</option>
+                    <option value="filename:asc">File name</option>
+                </select>
+            </div>
+            <div id="storedSessionList" style="margin-top: 10px; display: none;"></div>
         </div>
 
         <div id="loading">
@@ -836,6 +1630,12 @@ HTML_TEMPLATE = """<!DOCTYPE html>
                         <option value="2">2.0x</option>
                         <option value="5">5.0x</option>
                     </select>
+                    <select id="zoomControl" onchange="changeZoom()" style="padding: 8px; border-radius: 8px; border: 2px solid #ddd; font-weight: 600;">
+                        <option value="0" selected>Whole session</option>
+                        <option value="600">10 min</option>
+                        <option value="60">1 min</option>
+                        <option value="10">10 s</option>
+                    </select>
                 </div>
             </div>
 
@@ -904,23 +1704,144 @@ HTML_TEMPLATE = """<!DOCTYPE html>
         </div>
     </div>
 
-    <script>
-        let allDatasets = [];  // Array of all uploaded datasets
-        let currentData = null;  // Currently displayed dataset
-        let currentDatasetIndex = 0;
-        let animationTimer = null;
-        let currentFrame = 0;
-        let isPlaying = false;
-        let playbackSpeed = 1.0;
-        let fixedAxisRange = null;  // Fixed axis ranges for live visualization
-
-        function formatDuration(seconds) {
-            const hours = Math.floor(seconds / 3600);
-            const minutes = Math.floor((seconds % 3600) / 60);
-            if (hours > 0) {
-                return `${hours}h ${minutes}m`;
-            } else {
-                return `${minutes}m`;
+    <script id="payloadWorker" type="text/js-worker">
+        // Runs in a Web Worker (see getPayloadWorker): decodes /jobs and
+        // /frames payloads and lays their frames out as float32 columns
+        const sensorColorCache = {};
+        
+        // Decode a binary payload: uint32 header length, JSON header, then
+        // float32 times/angles/x/y buffers viewed in place
+        function decodeBinaryPayload(buffer) {
+            const headerLength = new DataView(buffer).getUint32(0, true);
+            const header = JSON.parse(new TextDecoder().decode(new Uint8Array(buffer, 4, headerLength)));
+            if (header.frames) {
+                const count = header.frames.count;
+                const sensors = header.frames.sensors;
+                let offset = 4 + headerLength;
+                const take = length => {
+                    const view = new Float32Array(buffer, offset, length);
+                    offset += length * 4;
+                    return view;
+                };
+                // Job statuses carry the frames of their single result
+                (header.results ? header.results[0] : header).frameColumns = {
+                    sensors: sensors,
+                    times: take(count),
+                    angles: take(count * sensors),
+                    xs: take(count * sensors),
+                    ys: take(count * sensors)
+                };
+                delete header.frames;
+            }
+            return header;
+        }
+        
+        // Split JSON frames' point lists into the same columns as binary ones
+        function columnsFromCurves(curves) {
+            const count = curves.length;
+            const sensors = count > 0 ? curves[0].angles.length : 0;
+            const columns = {
+                sensors: sensors,
+                times: new Float32Array(count),
+                angles: new Float32Array(count * sensors),
+                xs: new Float32Array(count * sensors),
+                ys: new Float32Array(count * sensors)
+            };
+            curves.forEach((curve, i) => {
+                const row = i * sensors;
+                columns.times[i] = curve.time;
+                columns.angles.set(curve.angles, row);
+                curve.points.forEach((point, j) => {
+                    columns.xs[row + j] = point[0];
+                    columns.ys[row + j] = point[1];
+                });
+            });
+            return columns;
+        }
+        
+        // Axis bounds over all frames, for results the server sent none for
+        function fillViewBounds(target, columns) {
+            const view = target.view || {};
+            if (view.x_range || columns.times.length === 0) return;
+            const range = values => {
+                let low = Infinity, high = -Infinity;
+                for (const value of values) {
+                    if (value < low) low = value;
+                    if (value > high) high = value;
+                }
+                return [low, high];
+            };
+            target.view = Object.assign({}, view, {
+                x_range: range(columns.xs),
+                y_range: range(columns.ys),
+                time_span: [columns.times[0], columns.times[columns.times.length - 1]]
+            });
+        }
+        
+        self.onmessage = event => {
+            const { id, buffer, binary } = event.data;
+            try {
+                const payload = binary ? decodeBinaryPayload(buffer)
+                    : JSON.parse(new TextDecoder().decode(buffer));
+                const transfers = [];
+                (payload.results || [payload]).forEach(target => {
+                    if (Array.isArray(target.spine_curves)) {
+                        target.frameColumns = columnsFromCurves(target.spine_curves);
+                        delete target.spine_curves;
+                    }
+                    const columns = target.frameColumns;
+                    if (!columns) return;
+                    columns.colors = sensorColors(columns.sensors);
+                    if (payload.results) fillViewBounds(target, columns);
+                    [columns.times, columns.angles, columns.xs, columns.ys].forEach(column => {
+                        if (!transfers.includes(column.buffer)) transfers.push(column.buffer);
+                    });
+                });
+                // Hand the frame buffers back without copying them
+                self.postMessage({ id: id, payload: payload }, transfers);
+            } catch (error) {
+                self.postMessage({ id: id, error: error.message });
+            }
+        };
+    </script>
+
+    <script>
+        let allDatasets = [];  // Array of all uploaded datasets
+        let currentData = null;  // Currently displayed dataset
+        let currentDatasetIndex = 0;
+        let animationTimer = null;
+        let currentFrame = 0;
+        let isPlaying = false;
+        let playbackSpeed = 1.0;
+        let fixedAxisRange = null;  // Fixed axis ranges for live visualization
+        let spinePlotReady = false;  // Live figure laid out for the current dataset
+        let renderRequest = null;  // Pending requestAnimationFrame for the live figure
+        let pendingFrame = 0;  // Frame that pending render will draw
+        let lastTickTime = null;  // Time of the last playback step
+        const sensorColorCache = {};  // Marker colors by sensor count
+        let zoomWindow = 0;  // Seconds of timeline shown when zoomed in (0 = whole session)
+        let zoomRequest = 0;  // Sequence number of the latest /frames request
+        const JOB_POLL_MS = 500;  // Interval between /jobs/<id> status polls
+        const UPLOAD_CONCURRENCY = 3;  // Files uploaded and analyzed at the same time
+        const STORED_SESSIONS_SHOWN = 50;  // Stored sessions listed at a time
+        let payloadWorker = null;  // Decodes response payloads off the main thread
+        const payloadRequests = new Map();  // Pending worker decodes by request id
+        let payloadRequestId = 0;
+
+        // Escape text, such as uploaded file names, for use in innerHTML
+        function escapeHtml(text) {
+            const div = document.createElement('div');
+            div.textContent = text;
+            return div.innerHTML;
+        }
+
+        function formatDuration(seconds) {
+            const hours = Math.floor(seconds / 3600);
+            const minutes = Math.floor((seconds % 3600) / 60);
+            if (hours > 0) {
+                return `${hours}h ${minutes}m`;
+            } else {
+                return `${minutes}m`;
             }
         }
 
@@ -941,54 +1862,54 @@ HTML_TEMPLATE = """<!DOCTYPE html>
             document.getElementById('loading').style.display = 'block';
             
             allDatasets = [];  // Reset datasets
+            currentDatasetIndex = 0;
+            
+            // Upload up to UPLOAD_CONCURRENCY files at once, each as its own
+            // request, and show every session as soon as it is analyzed
+            const uploads = Array.from(files, file => ({ file: file, state: 'queued', loaded: 0, total: file.size }));
+            const failures = [];
+            let next = 0;
+            const uploadWorker = async () => {
+                while (next < uploads.length) {
+                    const upload = uploads[next++];
+                    console.log(`   Processing file ${next}/${uploads.length}: ${upload.file.name}`);
+                    try {
+                        const data = await uploadAndAnalyze(upload, () => renderUploadProgress(uploads));
+                        if (data.error) throw new Error(data.error);
+                        console.log(`   ✅ Analyzed ${data.filename}`);
+                        upload.state = 'done';
+                        showArrivedDataset(data);
+                    } catch (error) {
+                        console.error(`   ❌ ${upload.file.name}:`, error);
+                        upload.state = 'failed';
+                        upload.error = error.message;
+                        failures.push(`${upload.file.name}: ${error.message}`);
+                    }
+                    renderUploadProgress(uploads);
+                }
+            };
+            renderUploadProgress(uploads);
 
             try {
-                // Upload each file
-                for (let i = 0; i < files.length; i++) {
-                    const file = files[i];
-                    console.log(`   Processing file ${i+1}/${files.length}: ${file.name}`);
-                    
-                    const formData = new FormData();
-                    formData.append('file', file);
-                    
-                    const response = await fetch('/upload', {
-                        method: 'POST',
-                        body: formData
-                    });
-                    
-                    console.log(`   Response status for ${file.name}:`, response.status);
-                    
-                    if (!response.ok) {
-                        const text = await response.text();
-                        console.error(`   Server error for ${file.name}:`, text);
-                        throw new Error(`Failed to analyze ${file.name}: ${response.status}`);
-                    }
-                    
-                    const data = await response.json();
-                    console.log(`   ✅ Analyzed ${file.name}`);
-                    
-                    allDatasets.push(data);
+                const workers = Math.min(UPLOAD_CONCURRENCY, uploads.length);
+                await Promise.all(Array.from({ length: workers }, uploadWorker));
+                
+                if (allDatasets.length === 0) {
+                    throw new Error(failures.join('\\n') || 'No files were analyzed');
+                }
+                if (failures.length > 0) {
+                    alert('Some files could not be analyzed:\\n\\n' + failures.join('\\n'));
                 }
                 
                 console.log(`✅ All ${allDatasets.length} files processed`);
                 
-                // Display file list
-                displayFileList();
-                
                 // Update filename display
-                if (allDatasets.length === 1) {
-                    document.getElementById('fileName').textContent = `📄 ${allDatasets[0].filename}`;
-                } else {
+                if (allDatasets.length > 1) {
                     const filenames = allDatasets.map(d => d.filename).join(', ');
                     document.getElementById('fileName').textContent = `📄 ${filenames}`;
-                }
-                
-                // Show comparison or single view
-                if (allDatasets.length > 1) {
+                    
+                    // Show comparison once every session is in
                     displayComparison();
-                } else {
-                    currentData = allDatasets[0];
-                    displayResults(allDatasets[0]);
                 }
                 
             } catch (error) {
@@ -999,6 +1920,162 @@ HTML_TEMPLATE = """<!DOCTYPE html>
             }
         }
         
+        // Upload one file (XHR, for byte progress), then poll its analysis job;
+        // resolves with the analysis result
+        async function uploadAndAnalyze(upload, onChange) {
+            upload.state = 'uploading';
+            onChange();
+            const job = await new Promise((resolve, reject) => {
+                const xhr = new XMLHttpRequest();
+                xhr.open('POST', '/upload');
+                xhr.responseType = 'json';
+                xhr.upload.onprogress = event => {
+                    upload.loaded = event.loaded;
+                    if (event.lengthComputable) upload.total = event.total;
+                    onChange();
+                };
+                xhr.onload = () => {
+                    if (xhr.status >= 200 && xhr.status < 300) {
+                        resolve(xhr.response);
+                    } else {
+                        reject(new Error(`Upload failed: ${xhr.status}`));
+                    }
+                };
+                xhr.onerror = () => reject(new Error('Upload failed: network error'));
+                
+                const formData = new FormData();
+                formData.append('file', upload.file);
+                xhr.send(formData);
+            });
+            
+            upload.state = 'analyzing';
+            onChange();
+            while (true) {
+                const statusResponse = await fetch(`/jobs/${job.job_id}?format=binary`);
+                if (!statusResponse.ok) {
+                    throw new Error(`Lost analysis job ${job.job_id}: ${statusResponse.status}`);
+                }
+                const status = await readPayload(statusResponse);
+                if (status.results.length > 0) return status.results[0];
+                
+                const state = status.status === 'queued' ? 'waiting' : 'analyzing';
+                if (state !== upload.state) {
+                    upload.state = state;
+                    onChange();
+                }
+                await new Promise(resolve => setTimeout(resolve, JOB_POLL_MS));
+            }
+        }
+        
+        // Add a finished session; the first one is displayed right away
+        function showArrivedDataset(data) {
+            allDatasets.push(data);
+            if (allDatasets.length === 1) {
+                currentData = data;
+                document.getElementById('fileName').textContent = `📄 ${data.filename}`;
+                document.getElementById('loading').style.display = 'none';
+                displayResults(data);
+            }
+            displayFileList();
+        }
+        
+        function renderUploadProgress(uploads) {
+            const listDiv = document.getElementById('uploadProgress');
+            listDiv.innerHTML = uploads.map(upload => {
+                const percent = upload.total ? Math.round(100 * upload.loaded / upload.total) : 0;
+                const megabytes = bytes => (bytes / (1024 * 1024)).toFixed(1);
+                let status;
+                let progress = percent;
+                if (upload.state === 'queued') {
+                    status = 'Waiting to upload';
+                    progress = 0;
+                } else if (upload.state === 'uploading') {
+                    status = `Uploading ${percent}% (${megabytes(upload.loaded)} / ${megabytes(upload.total)} MB)`;
+                } else if (upload.state === 'waiting') {
+                    status = 'Queued for analysis';
+                } else if (upload.state === 'analyzing') {
+                    status = '🔬 Analyzing...';
+                } else if (upload.state === 'done') {
+                    status = '✅ Done';
+                } else {
+                    status = `❌ ${escapeHtml(upload.error)}`;
+                }
+                return `
+                    <div class="upload-progress-item">
+                        <div class="file-name">${escapeHtml(upload.file.name)}</div>
+                        <div class="file-metrics">${status}</div>
+                        <div class="upload-progress-bar"><div style="width: ${progress}%"></div></div>
+                    </div>`;
+            }).join('');
+            listDiv.style.display = 'block';
+        }
+        
+        // Worker built from the payloadWorker script block, sharing the
+        // sensor color gradient with the page
+        function getPayloadWorker() {
+            if (!payloadWorker) {
+                const source = [
+                    sensorColors.toString(),
+                    document.getElementById('payloadWorker').textContent
+                ].join('\\n');
+                const url = URL.createObjectURL(new Blob([source], { type: 'text/javascript' }));
+                payloadWorker = new Worker(url);
+                payloadWorker.onmessage = event => {
+                    const { id, payload, error } = event.data;
+                    const request = payloadRequests.get(id);
+                    payloadRequests.delete(id);
+                    if (error) {
+                        request.reject(new Error(error));
+                    } else {
+                        request.resolve(payload);
+                    }
+                };
+                payloadWorker.onerror = event => {
+                    payloadRequests.forEach(request => request.reject(new Error(event.message || 'Payload worker failed')));
+                    payloadRequests.clear();
+                };
+            }
+            return payloadWorker;
+        }
+        
+        // Decode a response in the worker; binary and JSON payloads both come
+        // back with their frames as transferred float32 columns
+        async function readPayload(response) {
+            const contentType = response.headers.get('Content-Type') || '';
+            const buffer = await response.arrayBuffer();
+            const id = ++payloadRequestId;
+            const payload = await new Promise((resolve, reject) => {
+                payloadRequests.set(id, { resolve: resolve, reject: reject });
+                getPayloadWorker().postMessage({
+                    id: id,
+                    buffer: buffer,
+                    binary: contentType.startsWith('application/octet-stream')
+                }, [buffer]);
+            });
+            (payload.results || [payload]).forEach(target => {
+                if (target.frameColumns) {
+                    target.spine_curves = frameCurves(target.frameColumns);
+                    delete target.frameColumns;
+                }
+            });
+            return payload;
+        }
+        
+        // One frame object per row, viewing the columns in place
+        function frameCurves(columns) {
+            const sensors = columns.sensors;
+            sensorColorCache[sensors] = columns.colors;
+            return Array.from(columns.times, (time, i) => {
+                const row = i * sensors;
+                return {
+                    time: time,
+                    angles: columns.angles.subarray(row, row + sensors),
+                    x: columns.xs.subarray(row, row + sensors),
+                    y: columns.ys.subarray(row, row + sensors)
+                };
+            });
+        }
+        
         function displayFileList() {
             const listDiv = document.getElementById('fileList');
             listDiv.innerHTML = '<div style="color: rgba(255,255,255,0.7); font-weight: 700; margin-bottom: 10px; font-size: 14px;">📁 Loaded Sessions:</div>';
@@ -1010,7 +2087,7 @@ HTML_TEMPLATE = """<!DOCTYPE html>
                 
                 item.innerHTML = `
                     <div>
-                        <div class="file-name">${data.filename}</div>
+                        <div class="file-name">${escapeHtml(data.filename)}</div>
                         <div class="file-metrics">${data.duration.toFixed(0)}s • ${data.total_rom.toFixed(0)}° ROM • ${data.sensors} sensors</div>
                     </div>
                     <button class="comparison-toggle" onclick="event.stopPropagation(); selectDataset(${idx})">View</button>
@@ -1031,6 +2108,62 @@ HTML_TEMPLATE = """<!DOCTYPE html>
             listDiv.style.display = 'block';
         }
         
+        // List stored sessions from /sessions, filtered and sorted server-side
+        async function loadStoredSessionList() {
+            const [sort, order] = document.getElementById('storedSort').value.split(':');
+            const params = new URLSearchParams({ sort: sort, order: order, limit: STORED_SESSIONS_SHOWN });
+            const filter = document.getElementById('storedFilter').value.trim();
+            if (filter) params.set('filename', filter);
+            
+            const listDiv = document.getElementById('storedSessionList');
+            try {
+                const response = await fetch(`/sessions?${params}`);
+                if (!response.ok) throw new Error(`Failed to list sessions: ${response.status}`);
+                const listing = await response.json();
+                
+                listDiv.innerHTML = `<div class="file-metrics" style="margin-bottom: 10px;">Showing ${listing.sessions.length} of ${listing.total} stored sessions</div>`;
+                listing.sessions.forEach(summary => {
+                    const item = document.createElement('div');
+                    item.className = 'file-list-item';
+                    item.onclick = () => openStoredSession(summary.session_id);
+                    const stored = new Date(summary.created_at * 1000).toLocaleString();
+                    item.innerHTML = `
+                        <div>
+                            <div class="file-name">${escapeHtml(summary.filename)}</div>
+                            <div class="file-metrics">${stored} • ${formatDuration(summary.duration)} • ${summary.total_rom.toFixed(0)}° ROM • ${summary.max_curvature.toFixed(1)} cm max curvature</div>
+                        </div>
+                        <button class="comparison-toggle">Open</button>
+                    `;
+                    listDiv.appendChild(item);
+                });
+                listDiv.style.display = 'block';
+            } catch (error) {
+                console.error('❌ Error:', error);
+                alert('Error listing stored sessions: ' + error.message);
+            }
+        }
+        
+        // Load a stored session into the loaded sessions and show it
+        async function openStoredSession(sessionId) {
+            let idx = allDatasets.findIndex(data => data.session_id === sessionId);
+            if (idx < 0) {
+                document.getElementById('loading').style.display = 'block';
+                try {
+                    const response = await fetch(`/sessions/${sessionId}?format=binary`);
+                    if (!response.ok) throw new Error(`Failed to load session: ${response.status}`);
+                    allDatasets.push(await readPayload(response));
+                    idx = allDatasets.length - 1;
+                } catch (error) {
+                    console.error('❌ Error:', error);
+                    alert('Error loading stored session: ' + error.message);
+                    return;
+                } finally {
+                    document.getElementById('loading').style.display = 'none';
+                }
+            }
+            selectDataset(idx);
+        }
+        
         function selectDataset(idx) {
             currentDatasetIndex = idx;
             currentData = allDatasets[idx];
@@ -1159,7 +2292,7 @@ HTML_TEMPLATE = """<!DOCTYPE html>
                         y: y,
                         type: 'scatter',
                         mode: 'lines+markers',
-                        name: data.filename,
+                        name: escapeHtml(data.filename),
                         line: { 
                             color: colors[idx % colors.length], 
                             width: 7,
@@ -1171,7 +2304,7 @@ HTML_TEMPLATE = """<!DOCTYPE html>
                             color: colors[idx % colors.length],
                             line: { color: 'rgba(255,255,255,0.4)', width: 3 }
                         },
-                        hovertemplate: `<b>${data.filename}</b><br>(%{x:.0f}, %{y:.0f}) cm<extra></extra>`
+                        hovertemplate: `<b>${escapeHtml(data.filename)}</b><br>(%{x:.0f}, %{y:.0f}) cm<extra></extra>`
                     });
                 }
             });
@@ -1302,28 +2435,28 @@ HTML_TEMPLATE = """<!DOCTYPE html>
             
             // Initialize spine animation
             console.log('   Initializing spine animation...');
+            if (data.overviewCurves) {
+                data.spine_curves = data.overviewCurves;  // Undo any zoom
+            }
+            document.getElementById('zoomControl').value = '0';
+            zoomWindow = 0;
+            zoomRequest++;
+            currentFrame = 0;
+            spinePlotReady = false;  // New axes: lay the live figure out again
             if (data.spine_curves.length > 0) {
                 console.log('   Spine curves available:', data.spine_curves.length);
                 document.getElementById('timeSlider').max = data.spine_curves.length - 1;
                 
-                // Calculate fixed axis ranges across all frames
-                let allX = [];
-                let allY = [];
-                data.spine_curves.forEach(curve => {
-                    if (curve.points && curve.points.length > 0) {
-                        curve.points.forEach(p => {
-                            allX.push(p[0]);
-                            allY.push(p[1]);
-                        });
-                    }
-                });
-                
-                if (allX.length > 0 && allY.length > 0) {
+                // Fixed axis ranges across all frames, precomputed by the server
+                const view = data.view || {};
+                if (view.x_range && view.y_range) {
                     const padding = 10;
                     fixedAxisRange = {
-                        x: [Math.min(...allX) - padding, Math.max(...allX) + padding],
-                        y: [Math.min(...allY) - padding, Math.max(...allY) + padding]
+                        x: [view.x_range[0] - padding, view.x_range[1] + padding],
+                        y: [view.y_range[0] - padding, view.y_range[1] + padding]
                     };
+                } else {
+                    fixedAxisRange = null;
                 }
                 
                 drawSpineFrame(0);
@@ -1413,31 +2546,69 @@ HTML_TEMPLATE = """<!DOCTYPE html>
             }, {responsive: true, displayModeBar: false});
         }
 
+        // Color gradient from blue (top) to purple (middle) to pink (bottom),
+        // computed once per sensor count
+        function sensorColors(n) {
+            if (!sensorColorCache[n]) {
+                const colors = [];
+                for (let i = 0; i < n; i++) {
+                    const ratio = i / (n - 1);
+                    if (ratio < 0.33) {
+                        colors.push('#3b82f6');  // Blue - upper
+                    } else if (ratio < 0.67) {
+                        colors.push('#8b5cf6');  // Purple - middle
+                    } else {
+                        colors.push('#ec4899');  // Pink - lower
+                    }
+                }
+                sensorColorCache[n] = colors;
+            }
+            return sensorColorCache[n];
+        }
+        
+        // Draw a frame on the next animation frame; repeated calls before then
+        // (e.g. while scrubbing the slider) only draw the latest one
         function drawSpineFrame(frameIdx) {
+            pendingFrame = frameIdx;
+            if (renderRequest === null) {
+                renderRequest = requestAnimationFrame(() => {
+                    renderRequest = null;
+                    renderSpineFrame(pendingFrame);
+                });
+            }
+        }
+        
+        function renderSpineFrame(frameIdx) {
             if (!currentData || !currentData.spine_curves[frameIdx]) return;
             
             const curve = currentData.spine_curves[frameIdx];
-            const points = curve.points;
+            const x = curve.x;
+            const y = curve.y;
+            const n = x.length;
             
-            if (!points || points.length === 0) return;
+            if (n === 0) return;
             
-            const x = points.map(p => p[0]);
-            const y = points.map(p => p[1]);
-            const n = points.length;
+            const text = Array.from(x, (_, i) => `<b>Sensor ${i+1}</b><br>Angle: ${curve.angles[i].toFixed(0)}°<br>Position: (${x[i].toFixed(0)}, ${y[i].toFixed(0)}) cm`);
             
-            // Color gradient from blue (top) to purple (middle) to pink (bottom)
-            const colors = [];
-            for (let i = 0; i < n; i++) {
-                const ratio = i / (n - 1);
-                if (ratio < 0.33) {
-                    colors.push('#3b82f6');  // Blue - upper
-                } else if (ratio < 0.67) {
-                    colors.push('#8b5cf6');  // Purple - middle
-                } else {
-                    colors.push('#ec4899');  // Pink - lower
-                }
+            if (spinePlotReady && fixedAxisRange) {
+                // Figure and axes already laid out: only swap the spine traces' data
+                Plotly.restyle('spineViz', { x: [x, x], y: [y, y], text: [null, text] }, [0, 1]);
+            } else {
+                createSpinePlot(x, y, text);
+                spinePlotReady = true;
             }
             
+            // Update time display
+            const view = currentData.view;
+            const totalTime = view && view.time_span ? view.time_span[1]
+                : currentData.spine_curves[currentData.spine_curves.length - 1].time;
+            document.getElementById('timeDisplay').textContent = 
+                `${curve.time.toFixed(0)}s / ${totalTime.toFixed(0)}s`;
+        }
+        
+        function createSpinePlot(x, y, text) {
+            const colors = sensorColors(x.length);
+            
             Plotly.newPlot('spineViz', [
                 {
                     x: x,
@@ -1464,7 +2635,7 @@ HTML_TEMPLATE = """<!DOCTYPE html>
                         line: { color: 'rgba(255,255,255,0.4)', width: 3 },
                         symbol: 'circle'
                     },
-                    text: x.map((_, i) => `<b>Sensor ${i+1}</b><br>Angle: ${curve.angles[i].toFixed(0)}°<br>Position: (${x[i].toFixed(0)}, ${y[i].toFixed(0)}) cm`),
+                    text: text,
                     hovertemplate: '%{text}<extra></extra>',
                     name: 'Sensors'
                 },
@@ -1513,11 +2684,6 @@ HTML_TEMPLATE = """<!DOCTYPE html>
                 showlegend: false,
                 font: { family: 'Inter', color: 'rgba(255,255,255,0.7)' }
             }, {responsive: true, displayModeBar: false});
-            
-            // Update time display
-            const totalTime = currentData.spine_curves[currentData.spine_curves.length - 1].time;
-            document.getElementById('timeDisplay').textContent = 
-                `${curve.time.toFixed(0)}s / ${totalTime.toFixed(0)}s`;
         }
 
         function togglePlayback() {
@@ -1526,60 +2692,981 @@ HTML_TEMPLATE = """<!DOCTYPE html>
             
             if (isPlaying) {
                 btn.textContent = '⏸ Pause';
-                animate();
+                lastTickTime = null;
+                animationTimer = requestAnimationFrame(animate);
             } else {
                 btn.textContent = '▶️ Play';
                 if (animationTimer) {
-                    clearTimeout(animationTimer);
+                    cancelAnimationFrame(animationTimer);
                     animationTimer = null;
                 }
             }
         }
 
-        function animate() {
+        function animate(timestamp) {
+            animationTimer = null;
             if (!isPlaying || !currentData) return;
             
+            // Step at the nominal 20 frames per second (times the speed) on
+            // the browser's paint schedule; after a stall resume from now
+            // rather than racing to catch up
+            const frameInterval = 50 / playbackSpeed;
+            if (lastTickTime === null) lastTickTime = timestamp;
+            const elapsed = timestamp - lastTickTime;
+            if (elapsed < frameInterval) {
+                animationTimer = requestAnimationFrame(animate);
+                return;
+            }
+            lastTickTime = elapsed > 2 * frameInterval ? timestamp : lastTickTime + frameInterval;
+            
             currentFrame++;
             if (currentFrame >= currentData.spine_curves.length) {
+                if (zoomWindow) {
+                    // Zoomed in: continue with the next window of the session,
+                    // or wrap around to its start
+                    const curves = currentData.spine_curves;
+                    const overview = currentData.overviewCurves;
+                    let atTime = curves[curves.length - 1].time;
+                    if (atTime >= overview[overview.length - 1].time) {
+                        atTime = overview[0].time;
+                    }
+                    currentFrame = curves.length - 1;
+                    loadZoomWindow(atTime + zoomWindow / 2, atTime).then(() => {
+                        if (isPlaying && !animationTimer) {
+                            lastTickTime = null;
+                            animationTimer = requestAnimationFrame(animate);
+                        }
+                    });
+                    return;
+                }
                 currentFrame = 0;
             }
             
-            drawSpineFrame(currentFrame);
+            renderSpineFrame(currentFrame);
             document.getElementById('timeSlider').value = currentFrame;
             
-            const delay = 50 / playbackSpeed;
-            animationTimer = setTimeout(animate, delay);
+            animationTimer = requestAnimationFrame(animate);
         }
 
         function seekToFrame(value) {
             currentFrame = parseInt(value);
             drawSpineFrame(currentFrame);
             
+            // Zoomed in: dragging to either end of the slider pans the window
+            const curves = currentData ? currentData.spine_curves : [];
+            if (zoomWindow && curves.length > 1 && (currentFrame === 0 || currentFrame === curves.length - 1)) {
+                const atTime = curves[currentFrame].time;
+                loadZoomWindow(atTime, atTime);
+            }
+            
             if (isPlaying) {
                 isPlaying = false;
                 document.getElementById('playBtn').textContent = '▶️ Play';
-                if (animationTimer) clearTimeout(animationTimer);
+                if (animationTimer) {
+                    cancelAnimationFrame(animationTimer);
+                    animationTimer = null;
+                }
             }
         }
 
         function changeSpeed() {
             playbackSpeed = parseFloat(document.getElementById('speedControl').value);
         }
+
+        async function changeZoom() {
+            if (!currentData || currentData.spine_curves.length === 0) return;
+            
+            // Keep the frames from the upload response as the overview
+            if (!currentData.overviewCurves) {
+                currentData.overviewCurves = currentData.spine_curves;
+            }
+            
+            zoomWindow = parseFloat(document.getElementById('zoomControl').value);
+            const centerTime = currentData.spine_curves[currentFrame].time;
+            
+            if (!zoomWindow) {
+                zoomRequest++;  // Drop any window still loading
+                setFrames(currentData.overviewCurves, centerTime);
+                return;
+            }
+            
+            await loadZoomWindow(centerTime, centerTime);
+        }
+
+        async function loadZoomWindow(centerTime, atTime) {
+            // Fetch full-resolution frames around centerTime; the server picks
+            // the closest level of its precomputed frame pyramid
+            const request = ++zoomRequest;
+            const start = centerTime - zoomWindow / 2;
+            const end = centerTime + zoomWindow / 2;
+            const response = await fetch(`/frames?session=${currentData.session_id}&start=${start}&end=${end}&max_frames=500&format=binary`);
+            if (!response.ok) {
+                // Session no longer kept by the server: fall back to the overview
+                console.error('   Failed to load frames:', response.status);
+                if (request === zoomRequest) {
+                    zoomWindow = 0;
+                    document.getElementById('zoomControl').value = '0';
+                    setFrames(currentData.overviewCurves, atTime);
+                }
+                return;
+            }
+            const data = await readPayload(response);
+            
+            // Ignore responses overtaken by a newer request or by zooming out
+            if (request !== zoomRequest || !zoomWindow) return;
+            if (data.spine_curves.length > 0) {
+                setFrames(data.spine_curves, atTime);
+            }
+        }
+
+        function setFrames(curves, atTime) {
+            currentData.spine_curves = curves;
+            
+            // Stay on the frame closest to where playback was
+            let idx = 0;
+            while (idx < curves.length - 1 && curves[idx].time < atTime) idx++;
+            currentFrame = idx;
+            
+            const slider = document.getElementById('timeSlider');
+            slider.max = curves.length - 1;
+            slider.value = idx;
+            drawSpineFrame(idx);
+        }
     </script>
 </body>
 </html>"""
 
 
+# Analyzed sessions kept in memory for /frames, least recently used first
+SESSIONS = OrderedDict()
+SESSIONS_LOCK = threading.Lock()
+
+
+def register_session(session, session_id=None):
+    """Keep an analyzed Session for later frame queries and return its ID"""
+    if session_id is None:
+        session_id = uuid.uuid4().hex
+    with SESSIONS_LOCK:
+        SESSIONS[session_id] = session
+        while len(SESSIONS) > MAX_SESSIONS:
+            SESSIONS.popitem(last=False)
+    return session_id
+
+
+# Summary fields kept in indexed columns of the session store, so /sessions
+# filters and sorts without reading any frame data
+SESSION_SUMMARY_COLUMNS = ('filename', 'created_at', 'duration', 'sensors', 'samples', 'total_rom',
+                           'upper_rom', 'middle_rom', 'lower_rom', 'upper_angular_velocity',
+                           'middle_angular_velocity', 'lower_angular_velocity', 'max_curvature',
+                           'max_curvature_time')
+SESSION_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    session_id TEXT PRIMARY KEY,
+    filename TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    duration REAL,
+    sensors INTEGER,
+    samples INTEGER,
+    total_rom REAL,
+    upper_rom REAL,
+    middle_rom REAL,
+    lower_rom REAL,
+    upper_angular_velocity REAL,
+    middle_angular_velocity REAL,
+    lower_angular_velocity REAL,
+    max_curvature REAL,
+    max_curvature_time REAL
+);
+-- The pickled result and Session, apart from the summaries so listing never pages them in
+CREATE TABLE IF NOT EXISTS session_data (
+    session_id TEXT PRIMARY KEY REFERENCES sessions(session_id) ON DELETE CASCADE,
+    result BLOB NOT NULL,
+    session BLOB NOT NULL
+);
+""" + "".join(f"CREATE INDEX IF NOT EXISTS sessions_by_{column} ON sessions({column});\n"
+              for column in SESSION_SUMMARY_COLUMNS)
+_SESSION_STORES_READY = set()  # Store paths whose schema this process has set up
+
+
+@contextmanager
+def open_session_store():
+    """Connection to the SESSION_DB store, created on first use"""
+    path = SESSION_DB
+    if path not in _SESSION_STORES_READY:
+        path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    conn = sqlite3.connect(path, timeout=30)
+    try:
+        if path not in _SESSION_STORES_READY:
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.executescript(SESSION_SCHEMA)
+            _SESSION_STORES_READY.add(path)
+        conn.execute('PRAGMA foreign_keys=ON')
+        with conn:
+            yield conn
+    finally:
+        conn.close()
+
+
+def store_session(result, session):
+    """Save an analysis in the session store under result['session_id']"""
+    summary = dict(result, created_at=time.time())
+    with open_session_store() as conn:
+        conn.execute(f"INSERT INTO sessions (session_id, {', '.join(SESSION_SUMMARY_COLUMNS)}) "
+                     f"VALUES (?{', ?' * len(SESSION_SUMMARY_COLUMNS)})",
+                     [result['session_id']] + [summary[column] for column in SESSION_SUMMARY_COLUMNS])
+        conn.execute("INSERT INTO session_data (session_id, result, session) VALUES (?, ?, ?)",
+                     (result['session_id'], pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL),
+                      pickle.dumps(session, protocol=pickle.HIGHEST_PROTOCOL)))
+
+
+def load_stored_session(session_id):
+    """(result, session) stored under session_id, or None"""
+    with open_session_store() as conn:
+        row = conn.execute("SELECT result, session FROM session_data WHERE session_id = ?",
+                           (session_id,)).fetchone()
+    if row is None:
+        return None
+    return pickle.loads(row[0]), pickle.loads(row[1])
+
+
+def list_sessions(bounds=(), filename=None, sort='created_at', descending=True, limit=100, offset=0):
+    """Summaries of stored sessions, filtered and sorted on the indexed columns
+
+    Returns (total matching, requested page).
+    """
+    if sort not in SESSION_SUMMARY_COLUMNS:
+        raise ValueError(f"Cannot sort by {sort!r}")
+    clauses = []
+    params = []
+    for column, low, high in bounds:
+        if column not in SESSION_SUMMARY_COLUMNS:
+            raise ValueError(f"Cannot filter by {column!r}")
+        if low is not None:
+            clauses.append(f"{column} >= ?")
+            params.append(low)
+        if high is not None:
+            clauses.append(f"{column} <= ?")
+            params.append(high)
+    if filename:
+        clauses.append("instr(lower(filename), lower(?)) > 0")
+        params.append(filename)
+    where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+    # rowid breaks ties in index order, so pages never overlap
+    order = 'DESC' if descending else 'ASC'
+    
+    with open_session_store() as conn:
+        total = conn.execute(f"SELECT COUNT(*) FROM sessions {where}", params).fetchone()[0]
+        rows = conn.execute(f"SELECT session_id, {', '.join(SESSION_SUMMARY_COLUMNS)} FROM sessions {where} "
+                            f"ORDER BY {sort} {order}, rowid {order} LIMIT ? OFFSET ?",
+                            params + [limit, offset]).fetchall()
+    columns = ('session_id',) + SESSION_SUMMARY_COLUMNS
+    return total, [dict(zip(columns, row)) for row in rows]
+
+
+# Result cache hit/miss counters for /cache/stats
+CACHE_STATS = {'hits': 0, 'misses': 0}
+CACHE_STATS_LOCK = threading.Lock()
+
+
+def analysis_cache_key(content_digest):
+    """Cache key for an upload: its sha256 plus every parameter shaping the result"""
+    params = (ANALYSIS_VERSION, CSV_COLUMNS, CYCLE_WINDOW_MS, MAX_SPINE_FRAMES,
+              PYRAMID_FACTOR, STREAMING_THRESHOLD_BYTES, CURVATURE_BATCH_CYCLES)
+    return hashlib.sha256(f"{content_digest}:{params!r}".encode()).hexdigest()
+
+
+def load_cached_analysis(key):
+    """Cached (result, session) for key, or None; counts the hit or miss"""
+    path = CACHE_DIR / f"{key}.pickle"
+    try:
+        with open(path, 'rb') as f:
+            cached = pickle.load(f)
+        os.utime(path)
+    except FileNotFoundError:
+        cached = None
+    except Exception as e:
+        print(f"⚠ Dropping unreadable cache entry {path.name}: {e}")
+        path.unlink(missing_ok=True)
+        cached = None
+    
+    with CACHE_STATS_LOCK:
+        CACHE_STATS['hits' if cached is not None else 'misses'] += 1
+    return cached
+
+
+def store_cached_analysis(key, analysis):
+    """Write (result, session) to the cache, then evict down to CACHE_MAX_BYTES"""
+    CACHE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+    # Write under a private name first so readers never see a partial entry
+    with tempfile.NamedTemporaryFile('wb', dir=CACHE_DIR, suffix='.tmp', delete=False) as f:
+        pickle.dump(analysis, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(f.name, CACHE_DIR / f"{key}.pickle")
+    evict_cache()
+
+
+def samples_cache_key(content_digest):
+    """Samples cache key for a CSV: its sha256 plus what shapes the parsed columns"""
+    return hashlib.sha256(f"{content_digest}:{SAMPLES_MAGIC!r}:{CSV_COLUMNS!r}".encode()).hexdigest()
+
+
+def compact_sample_columns(columns):
+    """SampleColumns converted to the samples cache's column types"""
+    return SampleColumns(*(array(typecode, col) for typecode, col in zip(SAMPLES_TYPECODES, columns)))
+
+
+def load_cached_samples(key):
+    """Compact SampleColumns memory-mapped from the samples cache, or None"""
+    path = SAMPLES_DIR / f"{key}.samples"
+    try:
+        with open(path, 'rb') as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        os.utime(path)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        print(f"⚠ Dropping unreadable samples cache entry {path.name}: {e}")
+        path.unlink(missing_ok=True)
+        return None
+    
+    view = memoryview(mapped)
+    row_bytes = sum(array(typecode).itemsize for typecode in SAMPLES_TYPECODES)
+    count = view[8:16].cast('Q')[0] if len(view) >= 16 else -1
+    if view[:8] != SAMPLES_MAGIC or len(view) != 16 + count * row_bytes:
+        print(f"⚠ Dropping corrupt samples cache entry {path.name}")
+        view.release()
+        mapped.close()
+        path.unlink(missing_ok=True)
+        return None
+    
+    columns = []
+    offset = 16
+    for typecode in SAMPLES_TYPECODES:
+        size = count * array(typecode).itemsize
+        columns.append(view[offset:offset + size].cast(typecode))
+        offset += size
+    return SampleColumns(*columns)
+
+
+def store_cached_samples(key, columns):
+    """Write compact SampleColumns to the samples cache, then evict down to SAMPLES_MAX_BYTES"""
+    SAMPLES_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+    # Write under a private name first so readers never map a partial entry
+    with tempfile.NamedTemporaryFile('wb', dir=SAMPLES_DIR, suffix='.tmp', delete=False) as f:
+        f.write(SAMPLES_MAGIC)
+        f.write(array('Q', [len(columns.timestamps)]).tobytes())
+        for col in columns:
+            col.tofile(f)
+    os.replace(f.name, SAMPLES_DIR / f"{key}.samples")
+    evict_cache(SAMPLES_MAX_BYTES, SAMPLES_DIR, '*.samples')
+
+
+def _cache_entries(directory=None, pattern='*.pickle'):
+    """(mtime, size, path) of every cache entry, oldest first"""
+    entries = []
+    for path in (directory or CACHE_DIR).glob(pattern):
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            # Evicted by another worker meanwhile
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+    return sorted(entries)
+
+
+def evict_cache(max_bytes=CACHE_MAX_BYTES, directory=None, pattern='*.pickle'):
+    """Delete least recently used cache entries until they fit in max_bytes"""
+    entries = _cache_entries(directory, pattern)
+    total = sum(size for mtime, size, path in entries)
+    for mtime, size, path in entries:
+        if total <= max_bytes:
+            break
+        path.unlink(missing_ok=True)
+        total -= size
+
+
+def cache_stats():
+    """Hit/miss counters and current size of the result cache"""
+    entries = _cache_entries()
+    samples = _cache_entries(SAMPLES_DIR, '*.samples')
+    with CACHE_STATS_LOCK:
+        stats = dict(CACHE_STATS)
+    stats.update({
+        'entries': len(entries),
+        'bytes': sum(size for mtime, size, path in entries),
+        'max_bytes': CACHE_MAX_BYTES,
+        'samples': {
+            'entries': len(samples),
+            'bytes': sum(size for mtime, size, path in samples),
+            'max_bytes': SAMPLES_MAX_BYTES,
+        },
+    })
+    return stats
+
+
+# Worker processes shared by all uploads, started on first use
+_ANALYSIS_POOL = None
+_ANALYSIS_POOL_LOCK = threading.Lock()
+
+
+def get_analysis_pool():
+    """Process pool that analyzes uploaded files in parallel"""
+    global _ANALYSIS_POOL
+    with _ANALYSIS_POOL_LOCK:
+        if _ANALYSIS_POOL is None:
+            # Never fork the threaded server itself: other threads may hold locks
+            method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+            _ANALYSIS_POOL = ProcessPoolExecutor(max_workers=ANALYSIS_WORKERS,
+                                                 mp_context=multiprocessing.get_context(method))
+        return _ANALYSIS_POOL
+
+
+def submit_analysis(*args):
+    """Queue analyze_upload(*args) on the pool and return its future"""
+    global _ANALYSIS_POOL
+    pool = get_analysis_pool()
+    try:
+        return pool.submit(analyze_upload, *args)
+    except BrokenProcessPool:
+        print("⚠ Analysis pool broken by a dead worker; starting a new one")
+        with _ANALYSIS_POOL_LOCK:
+            if _ANALYSIS_POOL is pool:
+                _ANALYSIS_POOL = None
+        pool.shutdown(wait=False)
+        return get_analysis_pool().submit(analyze_upload, *args)
+
+
+class UploadBuffer:
+    """Bytes of one uploaded file, spilled to a temp file past spill_bytes"""
+    
+    def __init__(self, spill_bytes=UPLOAD_SPILL_BYTES):
+        self.spill_bytes = spill_bytes
+        self.data = bytearray()
+        self.file = None
+        self.size = 0
+        self.digest = hashlib.sha256()
+    
+    def write(self, payload):
+        self.size += len(payload)
+        self.digest.update(payload)
+        if self.file is None and self.size > self.spill_bytes:
+            self.file = tempfile.NamedTemporaryFile('wb', prefix='spine_upload_', suffix='.csv', delete=False)
+            self.file.write(self.data)
+            self.data = None
+        if self.file is not None:
+            self.file.write(payload)
+        else:
+            self.data += payload
+    
+    def close(self):
+        """Finish the upload and return what to analyze: the bytes or the temp file path"""
+        if self.file is None:
+            return self.data
+        self.file.close()
+        return self.file.name
+    
+    def discard(self):
+        if self.file is not None:
+            self.file.close()
+            os.remove(self.file.name)
+
+
+def discard_upload(source):
+    """Remove the temp file behind an upload source, if it spilled to one"""
+    if isinstance(source, str):
+        Path(source).unlink(missing_ok=True)
+
+
+def analyze_upload(source, original_filename, cache_key=None, content_digest=None):
+    """Analyze one uploaded file (bytes or spilled temp file path) in a worker process"""
+    try:
+        result, session = analyze_csv(source, original_filename, content_digest=content_digest)
+    finally:
+        discard_upload(source)
+    
+    if result:
+        result['session_id'] = uuid.uuid4().hex
+        try:
+            store_session(result, session)
+        except (OSError, sqlite3.Error) as e:
+            print(f"⚠ Could not store session {result['filename']}: {e}")
+    if result and cache_key is not None:
+        try:
+            store_cached_analysis(cache_key, (result, session))
+        except OSError as e:
+            print(f"⚠ Could not cache analysis of {result['filename']}: {e}")
+    return result, session
+
+
+def upload_outcome(future, filename):
+    """Result record for one finished analysis: the result or an error"""
+    try:
+        result, session = future.result()
+    except Exception as e:
+        print(f"   ❌ Analysis of {filename} failed: {e}")
+        return {'filename': filename, 'error': str(e)}
+    
+    if not result:
+        print(f"   ❌ Analysis of {filename} returned None")
+        return {'filename': filename, 'error': 'No data to analyze'}
+    
+    register_session(session, result['session_id'])
+    print(f"   ✅ Analysis of {filename} successful!")
+    return result
+
+
+class AnalysisJob:
+    """One upload's files queued on the analysis pool"""
+    
+    def __init__(self, job_id, futures):
+        self.job_id = job_id
+        self.futures = futures
+        self.results = []
+        self.finished_at = None
+        self.lock = threading.Lock()
+    
+    def record(self, outcome):
+        with self.lock:
+            self.results.append(outcome)
+            if len(self.results) == len(self.futures):
+                self.finished_at = time.monotonic()
+    
+    def status(self, after=0):
+        """Job status with the results from index `after` on"""
+        with self.lock:
+            results = self.results[after:]
+            completed = len(self.results)
+        if completed == len(self.futures):
+            state = 'done'
+        elif completed or any(future.running() for future in self.futures):
+            state = 'running'
+        else:
+            state = 'queued'
+        return {
+            'job_id': self.job_id,
+            'status': state,
+            'files': len(self.futures),
+            'completed': completed,
+            'results': results,
+        }
+
+
+# Analysis jobs by ID; finished ones expire after JOB_TTL_SECONDS
+JOBS = {}
+JOBS_LOCK = threading.Lock()
+
+
+def expire_jobs():
+    """Drop finished jobs older than JOB_TTL_SECONDS"""
+    cutoff = time.monotonic() - JOB_TTL_SECONDS
+    with JOBS_LOCK:
+        for job_id in [job_id for job_id, job in JOBS.items()
+                       if job.finished_at is not None and job.finished_at < cutoff]:
+            del JOBS[job_id]
+
+
+def submit_job(uploads):
+    """Queue (source, original_filename, content_digest) uploads, return the job"""
+    expire_jobs()
+    files = []
+    for i, (source, original_filename, content_digest) in enumerate(uploads):
+        try:
+            filename = original_filename or Path(_csv_source_label(source)).name
+            key = analysis_cache_key(content_digest)
+            cached = load_cached_analysis(key)
+            if cached is not None:
+                print(f"   ⚡ Cache hit for {filename}")
+                discard_upload(source)
+                cached[0]['filename'] = filename
+                future = Future()
+                future.set_result(cached)
+            else:
+                future = submit_analysis(source, original_filename, key, content_digest)
+                # A worker that dies never gets to delete its spilled upload
+                future.add_done_callback(lambda future, source=source: discard_upload(source))
+        except BaseException:
+            for source, original_filename, content_digest in uploads[i:]:
+                discard_upload(source)
+            raise
+        files.append((future, filename))
+    
+    job = AnalysisJob(uuid.uuid4().hex, [future for future, filename in files])
+    with JOBS_LOCK:
+        JOBS[job.job_id] = job
+    for future, filename in files:
+        future.add_done_callback(lambda future, filename=filename: job.record(upload_outcome(future, filename)))
+    return job
+
+
+def get_job(job_id):
+    """Look up an AnalysisJob (None if unknown or expired)"""
+    expire_jobs()
+    with JOBS_LOCK:
+        return JOBS.get(job_id)
+
+
+def get_session(session_id):
+    """Look up a Session kept in memory, or else in the session store (None if unknown)"""
+    with SESSIONS_LOCK:
+        session = SESSIONS.get(session_id)
+        if session is not None:
+            SESSIONS.move_to_end(session_id)
+    if session is None:
+        stored = load_stored_session(session_id)
+        if stored is not None:
+            session = stored[1]
+            register_session(session, session_id)
+    return session
+
+
+def frames_in_range(session, start, end, max_frames):
+    """Spine frames for the cycles between start and end seconds, at most max_frames"""
+    pyramid = session.pyramid
+    lo = bisect_left(pyramid[0].cycle_times, start * 1000)
+    hi = bisect_right(pyramid[0].cycle_times, end * 1000)
+    
+    # Closest level from the full-rate count: stride PYRAMID_FACTOR ** depth
+    depth = 0
+    count = hi - lo
+    while count > max_frames and depth < len(pyramid) - 1:
+        count = -(-count // PYRAMID_FACTOR)
+        depth += 1
+    level = pyramid[depth]
+    
+    lo = bisect_left(level.cycle_times, start * 1000)
+    hi = bisect_right(level.cycle_times, end * 1000)
+    stride = max(1, -(-(hi - lo) // max_frames))
+    
+    matrix = session.matrix
+    n_sensors = len(matrix.sensor_order)
+    spine_curves = []
+    for f in range(lo, hi, stride):
+        c = level.cycle_indices[f]
+        row = slice(f * n_sensors, (f + 1) * n_sensors)
+        spine_curves.append({
+            'time': level.cycle_times[f]/1000.0,
+            'points': list(zip(level.xs[row].tolist(), level.ys[row].tolist())),
+            'angles': matrix.angles[c * n_sensors:(c + 1) * n_sensors].tolist()
+        })
+    return spine_curves
+
+
+def iter_multipart(stream, boundary, content_length, chunk_size=UPLOAD_CHUNK_BYTES):
+    """Incrementally parse a multipart/form-data body read from stream
+
+    Yields ('headers', bytes), ('data', bytes) and ('end', None) events.
+    """
+    # Every delimiter but the first is preceded by CRLF; seed the buffer
+    # with one so the first matches the same pattern
+    delimiter = b'\r\n--' + boundary
+    keep = len(delimiter) + 1
+    buf = bytearray(b'\r\n')
+    remaining = content_length
+    state = 'preamble'
+    
+    while True:
+        if state == 'preamble':
+            # Skip to the next delimiter, then see whether it closes the body
+            i = buf.find(delimiter)
+            if i >= 0 and len(buf) >= i + len(delimiter) + 2:
+                after = bytes(buf[i + len(delimiter):i + len(delimiter) + 2])
+                del buf[:i + len(delimiter) + 2]
+                if after == b'--':
+                    while remaining:
+                        chunk = stream.read(min(chunk_size, remaining))
+                        if not chunk:
+                            break
+                        remaining -= len(chunk)
+                    return
+                state = 'headers'
+                continue
+            if i < 0:
+                del buf[:max(0, len(buf) - keep)]
+        elif state == 'headers':
+            i = buf.find(b'\r\n\r\n')
+            if i >= 0:
+                yield 'headers', bytes(buf[:i])
+                del buf[:i + 4]
+                state = 'data'
+                continue
+            if len(buf) > MAX_PART_HEADER_BYTES:
+                raise ValueError("Multipart part header too large")
+        else:
+            i = buf.find(delimiter)
+            if i >= 0:
+                if i:
+                    yield 'data', bytes(buf[:i])
+                yield 'end', None
+                del buf[:i]
+                state = 'preamble'
+                continue
+            # Hold back a tail that may be the start of a delimiter
+            if len(buf) > keep:
+                yield 'data', bytes(buf[:-keep])
+                del buf[:-keep]
+        
+        if not remaining:
+            raise ValueError("Multipart body ended before its closing boundary")
+        chunk = stream.read(min(chunk_size, remaining))
+        if not chunk:
+            raise ValueError("Connection closed before the upload was complete")
+        remaining -= len(chunk)
+        buf += chunk
+
+
+# Content codings we can produce, most preferred first
+RESPONSE_ENCODINGS = [name for name, module in (('zstd', zstandard), ('br', brotli), ('gzip', zlib))
+                      if module is not None]
+
+
+def negotiate_encoding(accept_encoding):
+    """Pick the response coding for an Accept-Encoding header (None = identity)"""
+    accepted = {}
+    for item in accept_encoding.split(','):
+        name, _, params = item.partition(';')
+        q = 1.0
+        for param in params.split(';'):
+            key, _, value = param.partition('=')
+            if key.strip() == 'q':
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        accepted[name.strip().lower()] = q
+    
+    for encoding in RESPONSE_ENCODINGS:
+        if accepted.get(encoding, accepted.get('*', 0.0)) > 0:
+            return encoding
+    return None
+
+
+def make_compressor(encoding):
+    """(compress, flush) functions streaming one response body in encoding"""
+    if encoding == 'zstd':
+        compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL).compressobj()
+        return compressor.compress, compressor.flush
+    if encoding == 'br':
+        compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+        return compressor.process, compressor.finish
+    # wbits=31 makes zlib write the gzip header and trailer
+    compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31)
+    return compressor.compress, compressor.flush
+
+
+def encode_json(value):
+    """value as JSON bytes, with orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(value).encode()
+
+
+def iter_json_chunks(obj, chunk_bytes=RESPONSE_CHUNK_BYTES):
+    """Encode obj as JSON exactly once, in pieces of about chunk_bytes"""
+    def pieces():
+        if not isinstance(obj, dict):
+            yield encode_json(obj)
+            return
+        # sorted() is stable: non-list fields keep their order, lists follow
+        fields = sorted(obj.items(), key=lambda field: isinstance(field[1], list))
+        yield b'{'
+        for i, (key, value) in enumerate(fields):
+            yield (b',' if i else b'') + encode_json(str(key)) + b':'
+            if isinstance(value, list):
+                yield b'['
+                for start in range(0, len(value), JSON_BATCH_ITEMS):
+                    # Drop the batch's own brackets to splice it into the list
+                    yield (b',' if start else b'') + encode_json(value[start:start + JSON_BATCH_ITEMS])[1:-1]
+                yield b']'
+            else:
+                yield encode_json(value)
+        yield b'}'
+    
+    pending = []
+    size = 0
+    for piece in pieces():
+        pending.append(piece)
+        size += len(piece)
+        if size >= chunk_bytes:
+            yield b''.join(pending)
+            pending = []
+            size = 0
+    if pending:
+        yield b''.join(pending)
+
+
+def encode_binary_frames(header, spine_curves=None):
+    """Pack a JSON header and spine frames as packed float32 buffers
+
+    Returns the body as a list of byte chunks.
+    """
+    buffers = []
+    if spine_curves is not None:
+        n_sensors = len(spine_curves[0]['angles']) if spine_curves else 0
+        header = dict(header, frames={'count': len(spine_curves), 'sensors': n_sensors})
+        buffers = [
+            array('f', (curve['time'] for curve in spine_curves)),
+            array('f', chain.from_iterable(curve['angles'] for curve in spine_curves)),
+            array('f', (x for curve in spine_curves for x, y in curve['points'])),
+            array('f', (y for curve in spine_curves for x, y in curve['points'])),
+        ]
+        if sys.byteorder == 'big':
+            for buf in buffers:
+                buf.byteswap()
+    
+    header_bytes = json.dumps(header).encode()
+    header_bytes += b' ' * (-len(header_bytes) % 4)
+    return [len(header_bytes).to_bytes(4, 'little') + header_bytes] + [buf.tobytes() for buf in buffers]
+
+
 class DashboardHandler(http.server.SimpleHTTPRequestHandler):
+    # HTTP/1.1 for chunked transfer encoding and keep-alive between polls
+    protocol_version = 'HTTP/1.1'
+    
     def do_GET(self):
-        if self.path == '/':
-            self.send_response(200)
-            self.send_header('Content-type', 'text/html')
-            self.end_headers()
-            self.wfile.write(HTML_TEMPLATE.encode())
+        url = urlsplit(self.path)
+        if url.path == '/':
+            self.send_body([HTML_TEMPLATE.encode()], 'text/html')
+        elif url.path == '/frames':
+            self.send_frames(parse_qs(url.query))
+        elif url.path == '/cache/stats':
+            self.send_json(cache_stats())
+        elif url.path == '/sessions':
+            self.send_sessions(parse_qs(url.query))
+        elif url.path.startswith('/sessions/'):
+            self.send_stored_session(url.path[len('/sessions/'):], parse_qs(url.query))
+        elif url.path.startswith('/jobs/'):
+            self.send_job(url.path[len('/jobs/'):], parse_qs(url.query))
         else:
             super().do_GET()
     
+    def send_json(self, obj, status=200):
+        self.send_body(iter_json_chunks(obj), 'application/json', status,
+                       [('Access-Control-Allow-Origin', '*')])
+    
+    def send_binary(self, header, spine_curves=None):
+        """Send the encode_binary_frames payload for header and frames"""
+        self.send_body(encode_binary_frames(header, spine_curves), 'application/octet-stream',
+                       headers=[('Access-Control-Allow-Origin', '*')])
+    
+    def send_body(self, chunks, content_type, status=200, headers=()):
+        """Send byte chunks as the response body, compressed as they are produced"""
+        chunked = self.request_version != 'HTTP/1.0'
+        encoding = negotiate_encoding(self.headers.get('Accept-Encoding', ''))
+        self.send_response(status)
+        self.send_header('Content-type', content_type)
+        for name, value in headers:
+            self.send_header(name, value)
+        self.send_header('Vary', 'Accept-Encoding')
+        if encoding:
+            self.send_header('Content-Encoding', encoding)
+        if chunked:
+            self.send_header('Transfer-Encoding', 'chunked')
+        else:
+            self.send_header('Connection', 'close')
+        self.end_headers()
+        
+        write = self.write_chunk if chunked else self.wfile.write
+        if encoding is None:
+            for chunk in chunks:
+                write(chunk)
+        else:
+            compress, flush = make_compressor(encoding)
+            for chunk in chunks:
+                write(compress(chunk))
+            write(flush())
+        if chunked:
+            self.wfile.write(b'0\r\n\r\n')
+    
+    def write_chunk(self, data):
+        """Write data as one HTTP chunk"""
+        # Compressors may hold data back; an empty chunk would end the body
+        if data:
+            self.wfile.write(b'%X\r\n%s\r\n' % (len(data), data))
+    
+    def send_frames(self, query):
+        """GET /frames?session=<id>&start=<s>&end=<s>&max_frames=<n>[&format=binary]"""
+        session_id = query.get('session', [''])[0]
+        session = get_session(session_id)
+        if session is None:
+            self.send_error(404, "Unknown or expired session")
+            return
+        
+        try:
+            start = float(query['start'][0]) if 'start' in query else float('-inf')
+            end = float(query['end'][0]) if 'end' in query else float('inf')
+            max_frames = int(query.get('max_frames', [MAX_SPINE_FRAMES])[0])
+        except ValueError:
+            self.send_error(400, "Invalid frame range")
+            return
+        max_frames = min(max(1, max_frames), MAX_FRAMES_PER_REQUEST)
+        
+        spine_curves = frames_in_range(session, start, end, max_frames)
+        if query.get('format', ['json'])[0] == 'binary':
+            self.send_binary({'session_id': session_id}, spine_curves)
+        else:
+            self.send_json({'session_id': session_id, 'spine_curves': spine_curves})
+    
+    def send_sessions(self, query):
+        """GET /sessions?sort=&order=&min_<column>=&max_<column>=&filename=&limit=&offset="""
+        try:
+            order = query.get('order', ['desc'])[0]
+            if order not in ('asc', 'desc'):
+                raise ValueError(f"Invalid order {order!r}")
+            bounds = []
+            for column in SESSION_SUMMARY_COLUMNS:
+                low = query.get(f"min_{column}", [None])[0]
+                high = query.get(f"max_{column}", [None])[0]
+                if low is not None or high is not None:
+                    bounds.append((column, None if low is None else float(low),
+                                   None if high is None else float(high)))
+            limit = min(max(1, int(query.get('limit', [100])[0])), MAX_SESSIONS_PER_LISTING)
+            offset = max(0, int(query.get('offset', [0])[0]))
+            total, sessions = list_sessions(bounds, query.get('filename', [None])[0],
+                                            query.get('sort', ['created_at'])[0], order == 'desc',
+                                            limit, offset)
+        except ValueError as e:
+            self.send_error(400, f"Invalid session query: {e}")
+            return
+        self.send_json({'total': total, 'sessions': sessions})
+    
+    def send_stored_session(self, session_id, query):
+        """GET /sessions/<id>[?format=binary]: a stored analysis result, as from /jobs"""
+        stored = load_stored_session(session_id)
+        if stored is None:
+            self.send_error(404, "Unknown session")
+            return
+        
+        result, session = stored
+        register_session(session, session_id)
+        if query.get('format', ['json'])[0] == 'binary':
+            self.send_binary({key: value for key, value in result.items() if key != 'spine_curves'},
+                             result['spine_curves'])
+        else:
+            self.send_json(result)
+    
+    def send_job(self, job_id, query):
+        """GET /jobs/<id>?after=<n>[&format=binary]: job status and results from index n on"""
+        job = get_job(job_id)
+        if job is None:
+            self.send_error(404, "Unknown or expired job")
+            return
+        
+        try:
+            after = max(0, int(query.get('after', [0])[0]))
+        except ValueError:
+            self.send_error(400, "Invalid result offset")
+            return
+        
+        status = job.status(after)
+        if query.get('format', ['json'])[0] != 'binary':
+            self.send_json(status)
+            return
+        
+        results = status['results'][:1]
+        spine_curves = results[0].get('spine_curves') if results else None
+        status['results'] = [{key: value for key, value in result.items() if key != 'spine_curves'}
+                             for result in results]
+        self.send_binary(status, spine_curves)
+    
     def do_POST(self):
         if self.path == '/upload':
             print("\n📥 Received upload request")
@@ -1588,9 +3675,6 @@ class DashboardHandler(http.server.SimpleHTTPRequestHandler):
                 content_length = int(self.headers['Content-Length'])
                 print(f"   Content length: {content_length} bytes")
                 
-                post_data = self.rfile.read(content_length)
-                print(f"   Read {len(post_data)} bytes")
-                
                 # Parse multipart form data
                 content_type = self.headers.get('Content-Type', '')
                 if 'boundary=' not in content_type:
@@ -1598,70 +3682,81 @@ class DashboardHandler(http.server.SimpleHTTPRequestHandler):
                     self.send_error(400, "Invalid Content-Type")
                     return
                 
-                boundary = content_type.split('boundary=')[1].encode()
+                boundary = content_type.split('boundary=')[1].split(';')[0].strip().strip('"').encode()
                 print(f"   Boundary: {boundary[:20]}...")
                 
-                parts = post_data.split(b'--' + boundary)
-                print(f"   Found {len(parts)} parts")
+                # Buffer each file part in memory, or in a temp file of its
+                # own when large; files are analyzed in parallel
+                uploads = []  # (source, original_filename, content_digest) per file part
+                try:
+                    self.receive_uploads(boundary, content_length, uploads)
+                except BaseException as e:
+                    # Aborted uploads (bad body, client reset, full disk)
+                    # must not leave spilled parts behind
+                    for source, original_filename, content_digest in uploads:
+                        discard_upload(source)
+                    if not isinstance(e, ValueError):
+                        raise
+                    print(f"   ❌ Invalid upload: {e}")
+                    self.send_error(400, f"Invalid upload: {e}")
+                    return
                 
-                for idx, part in enumerate(parts):
-                    if b'filename=' in part:
-                        print(f"   Processing part {idx} with filename")
-                        
-                        # Extract original filename from multipart header
-                        original_filename = None
-                        header_lines = part.split(b'\r\n\r\n', 1)[0].split(b'\r\n')
-                        for header_line in header_lines:
-                            if b'filename=' in header_line:
-                                # Extract filename from: Content-Disposition: form-data; name="file"; filename="original.csv"
-                                try:
-                                    filename_part = header_line.decode('utf-8', errors='ignore')
-                                    if 'filename="' in filename_part:
-                                        original_filename = filename_part.split('filename="')[1].split('"')[0]
-                                    elif "filename='" in filename_part:
-                                        original_filename = filename_part.split("filename='")[1].split("'")[0]
-                                    print(f"   Extracted filename: {original_filename}")
-                                except:
-                                    pass
-                        
-                        # Extract CSV content
-                        csv_content = part.split(b'\r\n\r\n', 1)[1]
-                        csv_content = csv_content.rsplit(b'\r\n', 1)[0]
-                        
-                        print(f"   CSV content size: {len(csv_content)} bytes")
-                        
-                        # Save temp file
-                        temp_path = '/tmp/spine_upload.csv'
-                        with open(temp_path, 'wb') as f:
-                            f.write(csv_content)
-                        
-                        print(f"   Saved to {temp_path}")
-                        print("   🔬 Starting analysis...")
-                        
-                        # Analyze
-                        result = load_and_analyze_csv(temp_path, original_filename)
-                        
-                        if result:
-                            print("   ✅ Analysis successful!")
-                            print(f"   Returning {len(json.dumps(result))} bytes of JSON")
-                            
-                            self.send_response(200)
-                            self.send_header('Content-type', 'application/json')
-                            self.send_header('Access-Control-Allow-Origin', '*')
-                            self.end_headers()
-                            self.wfile.write(json.dumps(result).encode())
-                            return
-                        else:
-                            print("   ❌ Analysis returned None")
+                if not uploads:
+                    print("   ❌ No valid file part found")
+                    self.send_error(400, "No valid file uploaded")
+                    return
                 
-                print("   ❌ No valid file part found")
-                self.send_error(400, "No valid file uploaded")
+                # Queue the analyses and answer right away; results are polled at /jobs/<id>
+                job = submit_job(uploads)
+                print(f"   🔬 Queued {len(uploads)} file(s) as job {job.job_id}")
+                self.send_json(job.status(), status=202)
                 
             except Exception as e:
                 print(f"   ❌ Exception in do_POST: {e}")
                 import traceback
                 traceback.print_exc()
                 self.send_error(500, f"Server error: {str(e)}")
+        else:
+            self.send_error(404, "Unknown endpoint")
+    
+    def receive_uploads(self, boundary, content_length, uploads):
+        """Collect every file part of the request body in an UploadBuffer"""
+        upload = None
+        try:
+            for event, payload in iter_multipart(self.rfile, boundary, content_length):
+                if event == 'headers':
+                    if b'filename=' not in payload:
+                        continue
+                    print(f"   Processing part {len(uploads) + 1} with filename")
+                    
+                    # Extract original filename from multipart header
+                    original_filename = None
+                    for header_line in payload.split(b'\r\n'):
+                        if b'filename=' in header_line:
+                            # Extract filename from: Content-Disposition: form-data; name="file"; filename="original.csv"
+                            try:
+                                filename_part = header_line.decode('utf-8', errors='ignore')
+                                if 'filename="' in filename_part:
+                                    original_filename = filename_part.split('filename="')[1].split('"')[0]
+                                elif "filename='" in filename_part:
+                                    original_filename = filename_part.split("filename='")[1].split("'")[0]
+                                print(f"   Extracted filename: {original_filename}")
+                            except:
+                                pass
+                    
+                    upload = UploadBuffer()
+                elif event == 'data' and upload is not None:
+                    upload.write(payload)
+                elif event == 'end' and upload is not None:
+                    source = upload.close()
+                    uploads.append((source, original_filename, upload.digest.hexdigest()))
+                    where = "memory" if upload.file is None else source
+                    print(f"   Received {upload.size} bytes into {where}")
+                    upload = None
+        finally:
+            # A part cut off by an error never made it into uploads
+            if upload is not None:
+                upload.discard()
     
     def log_message(self, format, *args):
         # Only log errors
@@ -1669,6 +3764,17 @@ class DashboardHandler(http.server.SimpleHTTPRequestHandler):
             super().log_message(format, *args)
 
 
+class DashboardServer(socketserver.ThreadingTCPServer):
+    """Serves each request on its own thread"""
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+def make_server(port=PORT):
+    """Create the dashboard HTTP server bound to port (0 picks a free one)"""
+    return DashboardServer(("", port), DashboardHandler)
+
+
 def main():
     print("╔═══════════════════════════════════════════════════════════╗")
     print("║       🏥 Spine Movement Analysis Dashboard 🏥            ║")
@@ -1696,8 +3802,7 @@ def main():
     print()
     
     # Start server
-    handler = DashboardHandler
-    with socketserver.TCPServer(("", PORT), handler) as httpd:
+    with make_server(PORT) as httpd:
         server_thread = threading.Thread(target=httpd.serve_forever, daemon=True)
         server_thread.start()
         
@@ -0,0 +1,363 @@
+import contextlib
+import gzip
+import http.client
+import io
+import json
+import math
+import os
+import socket
+import sys
+import tempfile
+import threading
+import unittest
+import unittest.mock
+from array import array
+from pathlib import Path
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+
+import spine_dashboard as sd
+
+
+def multipart_body(boundary, files, epilogue=b''):
+    """multipart/form-data body with one file part per (filename, data)"""
+    body = b''
+    for filename, data in files:
+        body += (f'--{boundary}\r\nContent-Disposition: form-data; name="file"; '
+                 f'filename="{filename}"\r\nContent-Type: text/csv\r\n\r\n').encode() + data + b'\r\n'
+    return body + f'--{boundary}--\r\n'.encode() + epilogue
+
+
+def synthetic_log(cycles=9000, n_sensors=8, cycle_ms=1000):
+    """CSV bytes of a smooth synthetic recording, one row per sensor reading"""
+    lines = [','.join(sd.CSV_COLUMNS)]
+    for c in range(cycles):
+        for sid in range(n_sensors):
+            phase = c / 50.0 + sid / 3.0
+            lines.append(f"{c * cycle_ms + sid * 3},{sid},{int(8000 * math.cos(phase / 4))},"
+                         f"{int(2000 * math.sin(phase))},{int(3000 * math.sin(phase / 2))},"
+                         f"{0.5 * math.sin(phase):.6f}")
+    return ('\n'.join(lines) + '\n').encode()
+
+
+class AngleKernelTest(unittest.TestCase):
+
+    def test_batch_angles_match_scalar_angles_on_edge_values(self):
+        # Both sides of the deadzone (245) and saturation (8028) limits
+        edges = (0, 1, 244, 245, 246, 8027, 8028, 8029, 8192)
+        values = sorted({sign * v for v in edges for sign in (1, -1)})
+        rows = [(ax, ay, az) for ax in values for ay in (0, -245, 244, 246) for az in values]
+        ax_col, ay_col, az_col = (list(col) for col in zip(*rows))
+        batch = sd.compute_angles_from_accel(ax_col, ay_col, az_col)
+        self.assertEqual(list(batch), [sd.compute_angle_from_accel(*row) for row in rows])
+
+
+class SegmentReadingCyclesTest(unittest.TestCase):
+
+    def test_chunked_segmentation_matches_whole_columns(self):
+        # Cycles end on a repeated sensor, a dropped reading or a time gap
+        timestamps, sensor_ids = [], []
+        ts = 0
+        for c in range(200):
+            for sid in range(c % 5 + 1):
+                if (c + sid) % 7 != 3:
+                    timestamps.append(ts)
+                    sensor_ids.append(sid)
+                ts += 3
+            ts += sd.CYCLE_WINDOW_MS + 1 if c % 11 == 0 else 5
+        starts, ids, _ = sd.segment_reading_cycles(timestamps, sensor_ids)
+
+        for chunk_rows in (1, 2, 7, 64):
+            chunk_starts, chunk_ids = [], []
+            sensor_bits, carry = {}, None
+            for i in range(0, len(timestamps), chunk_rows):
+                cycle_starts, cycle_ids, carry = sd.segment_reading_cycles(
+                    timestamps[i:i + chunk_rows], sensor_ids[i:i + chunk_rows], sensor_bits, carry)
+                # Rows of the cycle left open by the previous chunk have ID -1
+                offset = len(chunk_starts)
+                chunk_ids.extend(offset + cid if cid >= 0 else offset - 1 for cid in cycle_ids)
+                chunk_starts.extend(i + start for start in cycle_starts)
+            self.assertEqual(chunk_starts, list(starts))
+            self.assertEqual(chunk_ids, list(ids))
+
+
+class StreamingSourcesTest(unittest.TestCase):
+
+    def test_streaming_results_match_for_path_bytes_and_file_object(self):
+        # A file object is parsed CSV_CHUNK_ROWS rows at a time; samples after
+        # the first chunk must still be inside the kept (trimmed) range
+        data = synthetic_log()
+        self.assertGreater(data.count(b'\n'), sd.CSV_CHUNK_ROWS)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'log.csv')
+            with open(path, 'wb') as f:
+                f.write(data)
+
+            with contextlib.redirect_stdout(io.StringIO()):
+                results = [sd.load_and_analyze_csv(source, 'log.csv', streaming=True)
+                           for source in (path, data, io.BytesIO(data))]
+
+        self.assertGreater(results[0]['samples'], 0)
+        self.assertEqual(results[1], results[0])
+        self.assertEqual(results[2], results[0])
+
+
+class FindLastTimestampTest(unittest.TestCase):
+
+    def test_skips_nul_padding_and_gives_up_after_scan_limit(self):
+        data = synthetic_log(cycles=100)
+        last = int(data.rstrip().rsplit(b'\n', 1)[1].split(b',')[0])
+        for block_size in (7, 65536):
+            self.assertEqual(sd.find_last_timestamp(data, block_size), last)
+            self.assertEqual(sd.find_last_timestamp(data + bytes(1 << 20), block_size), last)
+        self.assertIsNone(sd.find_last_timestamp(data + b'x' * 4096, 1024, max_scan_bytes=2048))
+
+
+class IterMultipartTest(unittest.TestCase):
+
+    def test_reads_whole_body_when_closing_delimiter_ends_a_read(self):
+        # Pad the file so a read ends right after the closing "--", leaving
+        # only the final CRLF (and the epilogue) unread
+        chunk_size = 1024
+        for epilogue in (b'', b'epilogue\r\n'):
+            empty = multipart_body('b0undary', [('log.csv', b'')])
+            data = b'x' * (2 * chunk_size - (len(empty) - 2))
+            body = multipart_body('b0undary', [('log.csv', data)], epilogue)
+            self.assertEqual((len(body) - 2 - len(epilogue)) % chunk_size, 0)
+
+            stream = io.BytesIO(body + b'GET / HTTP/1.1\r\n')
+            events = list(sd.iter_multipart(stream, b'b0undary', len(body), chunk_size))
+
+            self.assertEqual(b''.join(payload for event, payload in events if event == 'data'), data)
+            self.assertEqual(stream.tell(), len(body))
+
+
+class NegotiateEncodingTest(unittest.TestCase):
+
+    def test_q_values_decide_acceptability_and_server_order_decides_preference(self):
+        cases = {
+            '': None,
+            'identity': None,
+            'gzip': 'gzip',
+            'gzip;q=0': None,
+            'gzip;q=0.0, identity': None,
+            'GZIP ; q=0.5': 'gzip',
+            'gzip;q=bogus': None,
+            'gzip;q=0.1, br;q=1': 'br',
+            'br;q=0, gzip': 'gzip',
+            'zstd;q=0.2, gzip, br': 'zstd',
+            '*': 'zstd',
+            '*;q=0': None,
+            '*, zstd;q=0': 'br',
+            '*;q=0, gzip': 'gzip',
+        }
+        with unittest.mock.patch.object(sd, 'RESPONSE_ENCODINGS', ['zstd', 'br', 'gzip']):
+            for header, expected in cases.items():
+                self.assertEqual(sd.negotiate_encoding(header), expected, header)
+
+
+class BinaryFramesTest(unittest.TestCase):
+
+    def test_frames_round_trip_through_float32_buffers(self):
+        spine_curves = [{'time': 0.25 * f,
+                         'angles': [f + 0.1 * s for s in range(3)],
+                         'points': [(f * 1.5 + s, -s * 9.0 + 0.3) for s in range(3)]}
+                        for f in range(5)]
+        body = b''.join(sd.encode_binary_frames({'status': 'done'}, spine_curves))
+
+        header_length = int.from_bytes(body[:4], 'little')
+        self.assertEqual(header_length % 4, 0)
+        header = json.loads(body[4:4 + header_length])
+        self.assertEqual(header, {'status': 'done', 'frames': {'count': 5, 'sensors': 3}})
+
+        floats = array('f', body[4 + header_length:])
+        if sys.byteorder == 'big':
+            floats.byteswap()
+        times, floats = floats[:5], floats[5:]
+        angles, xs, ys = floats[:15], floats[15:30], floats[30:]
+        expected = (
+            [curve['time'] for curve in spine_curves],
+            [angle for curve in spine_curves for angle in curve['angles']],
+            [x for curve in spine_curves for x, y in curve['points']],
+            [y for curve in spine_curves for x, y in curve['points']],
+        )
+        for got, want in zip((times, angles, xs, ys), expected):
+            self.assertEqual(len(got), len(want))
+            for g, w in zip(got, want):
+                self.assertAlmostEqual(g, w, places=5)
+
+    def test_header_only_without_frames(self):
+        body = b''.join(sd.encode_binary_frames({'status': 'running'}))
+        header_length = int.from_bytes(body[:4], 'little')
+        self.assertEqual(len(body), 4 + header_length)
+        self.assertEqual(json.loads(body[4:]), {'status': 'running'})
+
+
+class SamplesCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.samples_dir = Path(tmp.name) / 'samples'
+        patcher = unittest.mock.patch.object(sd, 'SAMPLES_DIR', self.samples_dir)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.columns = sd.compact_sample_columns(sd.SampleColumns(
+            [0, 3, 2 ** 31 - 1], [0, 1, 7], [-8192, 0, 8191], [1, -2, 3], [32767, -32768, 0], [0.5, -1.25, 0.0]))
+
+    def test_columns_round_trip(self):
+        key = sd.samples_cache_key('digest')
+        sd.store_cached_samples(key, self.columns)
+        loaded = sd.load_cached_samples(key)
+        self.assertEqual([list(col) for col in loaded], [list(col) for col in self.columns])
+        self.assertEqual([col.format for col in loaded], list(sd.SAMPLES_TYPECODES))
+        self.assertIsNone(sd.load_cached_samples(sd.samples_cache_key('other')))
+
+    def test_corrupt_entries_are_dropped(self):
+        key = sd.samples_cache_key('digest')
+        for damage in (lambda data: data[:-1], lambda data: b'X' + data[1:], lambda data: b''):
+            sd.store_cached_samples(key, self.columns)
+            path = self.samples_dir / f"{key}.samples"
+            path.write_bytes(damage(path.read_bytes()))
+            with contextlib.redirect_stdout(io.StringIO()):
+                self.assertIsNone(sd.load_cached_samples(key))
+            self.assertFalse(path.exists())
+
+    def test_out_of_range_values_do_not_compact(self):
+        with self.assertRaises(OverflowError):
+            sd.compact_sample_columns(sd.SampleColumns([2 ** 31], [0], [0], [0], [0], [0.0]))
+
+    def test_second_analysis_reads_cached_samples(self):
+        data = synthetic_log(cycles=300, cycle_ms=20)
+        with contextlib.redirect_stdout(io.StringIO()):
+            first, _ = sd.analyze_csv(data, 'log.csv', streaming=False)
+            self.assertEqual(len(list(self.samples_dir.glob('*.samples'))), 1)
+            with unittest.mock.patch.object(sd, 'iter_csv_chunks', side_effect=AssertionError('parsed again')):
+                second, _ = sd.analyze_csv(data, 'log.csv', streaming=False)
+        self.assertEqual(second, first)
+
+
+class SessionStoreTest(unittest.TestCase):
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        patcher = unittest.mock.patch.object(sd, 'SESSION_DB', Path(tmp.name) / 'sessions.sqlite3')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        for i, (filename, rom) in enumerate([('Morning.csv', 30.0), ('evening.csv', 45.0),
+                                            ('morning_walk.csv', 45.0), ('run.csv', 12.5)]):
+            result = dict.fromkeys(sd.SESSION_SUMMARY_COLUMNS, 1.0)
+            result.update(session_id=f's{i}', filename=filename, total_rom=rom, samples=100 * i)
+            with unittest.mock.patch.object(sd.time, 'time', return_value=1000.0 + i):
+                sd.store_session(result, {'frames': i})
+
+    def ids(self, sessions):
+        return [session['session_id'] for session in sessions]
+
+    def test_sorts_newest_first_and_pages(self):
+        total, sessions = sd.list_sessions()
+        self.assertEqual(total, 4)
+        self.assertEqual(self.ids(sessions), ['s3', 's2', 's1', 's0'])
+        self.assertEqual(sessions[0]['created_at'], 1003.0)
+        total, sessions = sd.list_sessions(limit=2, offset=1)
+        self.assertEqual(total, 4)
+        self.assertEqual(self.ids(sessions), ['s2', 's1'])
+
+    def test_ties_keep_a_stable_order(self):
+        total, sessions = sd.list_sessions(sort='total_rom', descending=False)
+        self.assertEqual(self.ids(sessions), ['s3', 's0', 's1', 's2'])
+        pages = [self.ids(sd.list_sessions(sort='total_rom', limit=1, offset=i)[1]) for i in range(4)]
+        self.assertEqual(pages, [['s2'], ['s1'], ['s0'], ['s3']])
+
+    def test_filters_by_ranges_and_filename(self):
+        total, sessions = sd.list_sessions(bounds=[('total_rom', 30.0, None)], sort='samples')
+        self.assertEqual((total, self.ids(sessions)), (3, ['s2', 's1', 's0']))
+        total, sessions = sd.list_sessions(bounds=[('total_rom', None, 40.0), ('samples', 100, 300)])
+        self.assertEqual((total, self.ids(sessions)), (1, ['s3']))
+        total, sessions = sd.list_sessions(filename='MORNING', sort='filename', descending=False)
+        self.assertEqual((total, self.ids(sessions)), (2, ['s0', 's2']))
+
+    def test_rejects_unknown_columns(self):
+        with self.assertRaises(ValueError):
+            sd.list_sessions(sort='session_id; DROP TABLE sessions')
+        with self.assertRaises(ValueError):
+            sd.list_sessions(bounds=[('rowid', 0, None)])
+
+    def test_loads_stored_result_and_session(self):
+        result, session = sd.load_stored_session('s2')
+        self.assertEqual((result['filename'], session), ('morning_walk.csv', {'frames': 2}))
+        self.assertIsNone(sd.load_stored_session('missing'))
+
+
+class ResponseFramingTest(unittest.TestCase):
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        for name in ('CACHE_DIR', 'SAMPLES_DIR'):
+            patcher = unittest.mock.patch.object(sd, name, Path(tmp.name) / name.lower())
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.server = sd.make_server(0)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        self.port = self.server.server_address[1]
+
+    def test_http11_response_is_chunked(self):
+        conn = http.client.HTTPConnection('127.0.0.1', self.port)
+        conn.request('GET', '/cache/stats')
+        response = conn.getresponse()
+        self.assertEqual(response.getheader('Transfer-Encoding'), 'chunked')
+        self.assertIn('hits', json.loads(response.read()))
+        conn.close()
+
+    def test_http10_response_is_unframed_and_closed(self):
+        with socket.create_connection(('127.0.0.1', self.port)) as sock:
+            sock.sendall(b'GET /cache/stats HTTP/1.0\r\nAccept-Encoding: gzip\r\n\r\n')
+            raw = b''.join(iter(lambda: sock.recv(65536), b''))
+        head, body = raw.split(b'\r\n\r\n', 1)
+        self.assertNotIn(b'transfer-encoding', head.lower())
+        self.assertIn(b'content-encoding: gzip', head.lower())
+        self.assertIn('hits', json.loads(gzip.decompress(body)))
+
+
+class UploadCleanupTest(unittest.TestCase):
+
+    def test_aborted_upload_removes_spilled_parts(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            buffers = []
+
+            class FullDiskBuffer(sd.UploadBuffer):
+                # Spills every part; the second part fails like a full disk
+                def __init__(self):
+                    super().__init__(spill_bytes=16)
+                    buffers.append(self)
+
+                def write(self, payload):
+                    if len(buffers) > 1:
+                        raise OSError(28, 'No space left on device')
+                    super().write(payload)
+
+            server = sd.make_server(0)
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+            self.addCleanup(server.server_close)
+            self.addCleanup(server.shutdown)
+
+            body = multipart_body('b0undary', [('a.csv', b'x' * 1000), ('b.csv', b'y' * 1000)])
+            with unittest.mock.patch.object(sd, 'UploadBuffer', FullDiskBuffer), \
+                    unittest.mock.patch.object(tempfile, 'tempdir', tmp), \
+                    contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+                conn = http.client.HTTPConnection('127.0.0.1', server.server_address[1])
+                conn.request('POST', '/upload', body, {'Content-Type': 'multipart/form-data; boundary=b0undary'})
+                status = conn.getresponse().status
+                conn.close()
+
+            self.assertEqual(status, 500)
+            self.assertIsNotNone(buffers[0].file)
+            self.assertEqual(os.listdir(tmp), [])
+
+
+if __name__ == '__main__':
+    unittest.main()